@@ -9,13 +9,29 @@ Polymarket has two credential systems:
 When POLY_API_KEY is empty, the bot derives CLOB creds from POLY_PRIVATE_KEY at startup.
 """
 
+import hashlib
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from config import BotConfig
 
 logger = logging.getLogger("auth")
 
+# Memoized per private key (sha256 digest, never the raw key): building a py-clob-client
+# instance sets up an EOA signer, so re-derives on reconnect shouldn't repeat that work.
+_derive_cache: Dict[Tuple, dict] = {}
+_signer_cache: Dict[bytes, str] = {}
+
+
+def _key_digest(private_key: str) -> bytes:
+    return hashlib.sha256(private_key.encode("utf-8")).digest()
+
+
+def _normalize_address(addr: Optional[str]) -> Optional[str]:
+    if not addr:
+        return None
+    return addr if addr.startswith("0x") else f"0x{addr}"
+
 
 def derive_clob_creds(config: BotConfig) -> Optional[dict]:
     """
@@ -25,13 +41,17 @@ def derive_clob_creds(config: BotConfig) -> Optional[dict]:
     """
     if not (config.PRIVATE_KEY or "").strip():
         return None
+    host = (config.CLOB_API_URL or "https://clob.polymarket.com").rstrip("/")
+    sig_type = 1 if getattr(config, "PROXY_WALLET", None) else 0
+    funder = getattr(config, "PROXY_WALLET", None) or None
+    digest = _key_digest(config.PRIVATE_KEY)
+    cache_key = (digest, host, config.CHAIN_ID, sig_type, funder)
+    cached = _derive_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
     try:
         from py_clob_client.client import ClobClient as PyClobClient
 
-        host = (config.CLOB_API_URL or "https://clob.polymarket.com").rstrip("/")
-        sig_type = 1 if getattr(config, "PROXY_WALLET", None) else 0
-        funder = getattr(config, "PROXY_WALLET", None) or None
-
         client = PyClobClient(
             host=host,
             chain_id=config.CHAIN_ID,
@@ -43,13 +63,21 @@ def derive_clob_creds(config: BotConfig) -> Optional[dict]:
         creds = client.create_or_derive_api_creds()
         if not creds:
             return None
-        if isinstance(creds, dict):
-            return creds
-        return {
-            "api_key": getattr(creds, "api_key", ""),
-            "api_secret": getattr(creds, "api_secret", ""),
-            "api_passphrase": getattr(creds, "api_passphrase", ""),
-        }
+        # Same client already holds the signer — grab the address so get_signer_address needn't rebuild it
+        try:
+            addr = _normalize_address(client.get_address())
+            if addr:
+                _signer_cache[digest] = addr
+        except Exception as e:
+            logger.debug(f"Signer address lookup during derive failed: {e}")
+        if not isinstance(creds, dict):
+            creds = {
+                "api_key": getattr(creds, "api_key", ""),
+                "api_secret": getattr(creds, "api_secret", ""),
+                "api_passphrase": getattr(creds, "api_passphrase", ""),
+            }
+        _derive_cache[cache_key] = dict(creds)
+        return creds
     except Exception as e:
         logger.error(f"Failed to derive CLOB credentials: {e}", exc_info=True)
         return None
@@ -63,6 +91,10 @@ def get_signer_address(config: BotConfig) -> Optional[str]:
     key = (config.PRIVATE_KEY or "").strip()
     if not key:
         return getattr(config, "PROXY_WALLET", None)
+    digest = _key_digest(config.PRIVATE_KEY)
+    cached = _signer_cache.get(digest)
+    if cached:
+        return cached
     try:
         from py_clob_client.client import ClobClient as PyClobClient
         client = PyClobClient(
@@ -71,9 +103,10 @@ def get_signer_address(config: BotConfig) -> Optional[str]:
             key=key,
             creds=None,
         )
-        addr = client.get_address()
+        addr = _normalize_address(client.get_address())
         if addr:
-            return addr if addr.startswith("0x") else f"0x{addr}"
+            _signer_cache[digest] = addr
+            return addr
     except Exception as e:
         logger.warning(f"Could not derive signer address: {e}")
     return getattr(config, "PROXY_WALLET", None)
@@ -7,13 +7,18 @@ import asyncio
 import json
 import logging
 import time
-from collections import deque
-from datetime import datetime, timezone
+from collections import defaultdict, deque
 from typing import Dict, Optional, TYPE_CHECKING
 
 import aiohttp
 import websockets
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # C parser; accepts the str/bytes frames websockets yields
+except ImportError:
+    _json_loads = json.loads
+
 if TYPE_CHECKING:
     from config import BotConfig
 
@@ -36,6 +41,29 @@ COINBASE_SYMBOL_MAP = {
     "SOL-USD": "SOL", "XRP-USD": "XRP",
 }
 
+# Subscribe payloads are constant: serialize once. Kept as str so they go out as text frames
+# (bytes would be sent as binary frames, which the exchanges don't accept for control messages).
+KRAKEN_SUBSCRIBE_MSG = json.dumps({
+    "event": "subscribe",
+    "pair": KRAKEN_PAIRS,
+    "subscription": {"name": "ticker"},
+})
+COINBASE_SUBSCRIBE_MSG = json.dumps({
+    "type": "subscribe",
+    "product_ids": COINBASE_PRODUCTS,
+    "channels": ["ticker"],
+})
+
+# Ticker frames are tiny JSON: permessage-deflate costs more CPU than it saves bandwidth
+WS_CONNECT_KWARGS = {
+    "compression": None,
+    "max_size": 2 ** 20,
+    "ping_interval": 20,
+    "ping_timeout": 20,
+}
+
+WS_CONNECT_TIMEOUT = 10  # seconds to wait for either exchange to accept the subscribe
+
 COINGECKO_IDS = {"BTC": "bitcoin", "ETH": "ethereum", "SOL": "solana", "XRP": "ripple"}
 BINANCE_FUTURES_FUNDING_URL = "https://fapi.binance.com/fapi/v1/premiumIndex"
 COINGECKO_PRICE_URL = (
@@ -47,6 +75,23 @@ WINDOW_MINUTES = 15
 BUFFER_SIZE = 100
 REST_POLL_INTERVAL = 30  # seconds (CoinGecko free tier ~10-20 req/min)
 COINGECKO_RATE_LIMIT_BACKOFF = 90  # seconds when 429 received
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15)
+COINGECKO_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+def _new_session() -> aiohttp.ClientSession:
+    """REST session for Binance/CoinGecko: long keepalive so polls skip TCP/TLS re-handshakes."""
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=16,
+        keepalive_timeout=120,
+        ttl_dns_cache=300,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        timeout=REQUEST_TIMEOUT,
+    )
 
 
 class BinanceFeed:
@@ -54,21 +99,26 @@ class BinanceFeed:
         self.config = config
         self.latest_prices: Dict[str, float] = {}
         self.window_open_prices: Dict[str, float] = {}
+        # Prices only: timestamps were never read back, so no per-tick tuple allocation
         self.price_history_buffer: Dict[str, deque] = {
             sym: deque(maxlen=BUFFER_SIZE) for sym in ("BTC", "ETH", "SOL", "XRP")
         }
         self._ws: Optional[object] = None
         self._running = False
-        self._last_window_minute: Optional[int] = None
-        self._funding_cache: Dict[str, tuple] = {}  # symbol -> (rate, timestamp)
+        self._last_window: Optional[int] = None  # epoch // window length
+        self._funding_cache: Dict[str, tuple] = {}  # symbol -> (rate, monotonic timestamp)
+        self._funding_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._funding_refreshes: Dict[str, asyncio.Task] = {}
         self._session: Optional[aiohttp.ClientSession] = None
         self._feed_task: Optional[asyncio.Task] = None
+        self._window_task: Optional[asyncio.Task] = None
 
     async def start(self):
         """Start the price feed — tries Kraken, Coinbase, then CoinGecko."""
         self._running = True
-        self._session = aiohttp.ClientSession()
+        self._session = _new_session()
         self._feed_task = asyncio.create_task(self._run_feed_loop())
+        self._window_task = asyncio.create_task(self._window_loop())
         await asyncio.sleep(2)
         logger.info("BinanceFeed started — waiting for price data")
 
@@ -76,89 +126,141 @@ class BinanceFeed:
         """Stop the feed and cleanup resources."""
         self._running = False
         self._ws = None
-        if self._feed_task and not self._feed_task.done():
-            self._feed_task.cancel()
-            try:
-                await self._feed_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._feed_task, self._window_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        for task in self._funding_refreshes.values():
+            task.cancel()
+        self._funding_refreshes.clear()
         if self._session:
             await self._session.close()
             self._session = None
         logger.debug("BinanceFeed stopped")
 
     async def _run_feed_loop(self):
-        """Try feeds in priority order until one works."""
-        for feed in PRICE_FEED_PRIORITY:
-            if not self._running:
+        """Race Kraken and Coinbase connects, stream from the winner; fall back to the other, then CoinGecko."""
+        consumers = {"kraken": self._consume_kraken, "coinbase": self._consume_coinbase}
+        remaining = [f for f in PRICE_FEED_PRIORITY if f in consumers]
+        while remaining and self._running:
+            try:
+                feed, ws = await self._race_ws_connects(remaining)
+            except asyncio.CancelledError:
                 return
+            except Exception as e:
+                logger.warning(f"WebSocket feeds failed to connect: {e} — trying next")
+                break
+            remaining.remove(feed)
             try:
-                if feed == "kraken":
-                    await self._connect_kraken()
-                    return
-                elif feed == "coinbase":
-                    await self._connect_coinbase()
-                    return
-                elif feed == "coingecko":
-                    logger.warning("Falling back to CoinGecko REST — rate limits apply")
-                    await self._poll_coingecko()
-                    return
+                async with ws:
+                    await consumers[feed](ws)
+                return
             except asyncio.CancelledError:
                 return
             except Exception as e:
                 logger.warning(f"{feed} feed failed: {e} — trying next")
+        if not self._running:
+            return
+        try:
+            logger.warning("Falling back to CoinGecko REST — rate limits apply")
+            await self._poll_coingecko()
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            logger.warning(f"coingecko feed failed: {e}")
 
-    async def _connect_kraken(self):
+    async def _race_ws_connects(self, feeds: list) -> tuple:
+        """Open the given WS feeds concurrently; return (feed, ws) for the first that subscribes.
+        A hung handshake on one exchange no longer delays the other. Ties go to priority order.
+        """
+        openers = {"kraken": self._open_kraken, "coinbase": self._open_coinbase}
+        tasks = {asyncio.create_task(openers[f]()): f for f in feeds}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=WS_CONNECT_TIMEOUT, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise TimeoutError(f"no WebSocket feed connected within {WS_CONNECT_TIMEOUT}s")
+                opened = []
+                for task in done:
+                    if task.exception() is None:
+                        opened.append(task)
+                    else:
+                        logger.warning(f"{tasks[task]} connect failed: {task.exception()}")
+                if opened:
+                    opened.sort(key=lambda t: feeds.index(tasks[t]))
+                    for extra in opened[1:]:
+                        await extra.result().close()
+                    return tasks[opened[0]], opened[0].result()
+            raise RuntimeError("all WebSocket feeds failed to connect")
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _open_kraken(self):
         """Kraken WebSocket — US accessible, no API key needed for public data."""
-        subscribe_msg = {
-            "event": "subscribe",
-            "pair": KRAKEN_PAIRS,
-            "subscription": {"name": "ticker"},
-        }
-        async with websockets.connect(KRAKEN_WS_URL) as ws:
-            await ws.send(json.dumps(subscribe_msg))
-            logger.info("Price feed: Kraken WebSocket connected")
-            while self._running:
-                try:
-                    msg = json.loads(await ws.recv())
-                except Exception as e:
-                    raise RuntimeError(f"Kraken recv error: {e}") from e
-                if isinstance(msg, list) and len(msg) >= 4:
-                    pair = msg[3]
-                    data = msg[1]
-                    if isinstance(data, dict) and "c" in data:
-                        price = float(data["c"][0])
-                        symbol = KRAKEN_SYMBOL_MAP.get(pair)
-                        if symbol and price > 0:
-                            self.latest_prices[symbol] = price
-                            self.price_history_buffer[symbol].append((price, time.time()))
-                            self._update_window_open_prices()
-
-    async def _connect_coinbase(self):
+        ws = await websockets.connect(KRAKEN_WS_URL, **WS_CONNECT_KWARGS)
+        try:
+            await ws.send(KRAKEN_SUBSCRIBE_MSG)
+        except BaseException:
+            await ws.close()
+            raise
+        return ws
+
+    async def _open_coinbase(self):
         """Coinbase WebSocket — US accessible, no API key for public ticker."""
-        subscribe_msg = {
-            "type": "subscribe",
-            "product_ids": COINBASE_PRODUCTS,
-            "channels": ["ticker"],
-        }
-        async with websockets.connect(COINBASE_WS_URL) as ws:
-            await ws.send(json.dumps(subscribe_msg))
-            logger.info("Price feed: Coinbase WebSocket connected")
-            while self._running:
-                try:
-                    msg = json.loads(await ws.recv())
-                except Exception as e:
-                    raise RuntimeError(f"Coinbase recv error: {e}") from e
-                if isinstance(msg, dict) and msg.get("type") == "ticker":
-                    product = msg.get("product_id")
-                    price_str = msg.get("price")
-                    symbol = COINBASE_SYMBOL_MAP.get(product) if product else None
-                    if symbol and price_str:
-                        price = float(price_str)
-                        if price > 0:
-                            self.latest_prices[symbol] = price
-                            self.price_history_buffer[symbol].append((price, time.time()))
-                            self._update_window_open_prices()
+        ws = await websockets.connect(COINBASE_WS_URL, **WS_CONNECT_KWARGS)
+        try:
+            await ws.send(COINBASE_SUBSCRIBE_MSG)
+        except BaseException:
+            await ws.close()
+            raise
+        return ws
+
+    async def _consume_kraken(self, ws):
+        logger.info("Price feed: Kraken WebSocket connected")
+        symbol_for = KRAKEN_SYMBOL_MAP.get
+        latest = self.latest_prices
+        history = self.price_history_buffer
+        while self._running:
+            try:
+                msg = _json_loads(await ws.recv())
+            except Exception as e:
+                raise RuntimeError(f"Kraken recv error: {e}") from e
+            if isinstance(msg, list) and len(msg) >= 4:
+                pair = msg[3]
+                data = msg[1]
+                if isinstance(data, dict) and "c" in data:
+                    price = float(data["c"][0])
+                    symbol = symbol_for(pair)
+                    if symbol and price > 0:
+                        latest[symbol] = price
+                        history[symbol].append(price)
+
+    async def _consume_coinbase(self, ws):
+        logger.info("Price feed: Coinbase WebSocket connected")
+        symbol_for = COINBASE_SYMBOL_MAP.get
+        latest = self.latest_prices
+        history = self.price_history_buffer
+        while self._running:
+            try:
+                msg = _json_loads(await ws.recv())
+            except Exception as e:
+                raise RuntimeError(f"Coinbase recv error: {e}") from e
+            if isinstance(msg, dict) and msg.get("type") == "ticker":
+                product = msg.get("product_id")
+                price_str = msg.get("price")
+                symbol = symbol_for(product) if product else None
+                if symbol and price_str:
+                    price = float(price_str)
+                    if price > 0:
+                        latest[symbol] = price
+                        history[symbol].append(price)
 
     async def _poll_coingecko(self):
         """CoinGecko REST polling — last resort, heavily rate limited."""
@@ -181,38 +283,39 @@ class BinanceFeed:
 
     async def _fetch_coingecko_prices(self):
         """Fetch BTC, ETH, SOL, XRP from CoinGecko."""
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with self._session.get(COINGECKO_PRICE_URL, timeout=timeout) as resp:
+        async with self._session.get(COINGECKO_PRICE_URL, timeout=COINGECKO_TIMEOUT) as resp:
             if resp.status == 429:
                 await resp.read()
                 raise RuntimeError("CoinGecko rate limited (429)")
             resp.raise_for_status()
             data = await resp.json()
-        now = time.time()
         for symbol, cg_id in COINGECKO_IDS.items():
             price = data.get(cg_id, {}).get("usd")
             if price and price > 0:
-                self.latest_prices[symbol] = float(price)
-                self.price_history_buffer[symbol].append((float(price), now))
-        self._update_window_open_prices()
+                price = float(price)  # JSON number already; one coercion shared by both stores
+                self.latest_prices[symbol] = price
+                self.price_history_buffer[symbol].append(price)
+
+    async def _window_loop(self):
+        """Check window boundaries once a second instead of on every ticker frame."""
+        while self._running:
+            self._update_window_open_prices()
+            await asyncio.sleep(1.0)
 
     def _update_window_open_prices(self):
         """Reset window_open_prices on each 15-min clock boundary."""
-        now = datetime.now(timezone.utc)
-        minute = now.minute
-        current_window = minute // WINDOW_MINUTES
-        if self._last_window_minute is not None:
-            last_window = self._last_window_minute // WINDOW_MINUTES
-            if current_window != last_window:
-                for sym, price in self.latest_prices.items():
-                    if price > 0:
-                        self.window_open_prices[sym] = price
-                logger.info(f"Window open prices updated: {self.window_open_prices}")
-        self._last_window_minute = minute
         if not self.window_open_prices and self.latest_prices:
             for sym, price in self.latest_prices.items():
                 if price > 0:
                     self.window_open_prices[sym] = price
+        # 15-min windows are aligned to the hour, so epoch seconds bucket the same way
+        current_window = int(time.time()) // (WINDOW_MINUTES * 60)
+        if self._last_window is not None and current_window != self._last_window:
+            for sym, price in self.latest_prices.items():
+                if price > 0:
+                    self.window_open_prices[sym] = price
+            logger.info(f"Window open prices updated: {self.window_open_prices}")
+        self._last_window = current_window
 
     def get_price(self, symbol: str) -> Optional[float]:
         """Get latest spot price for symbol (e.g. 'BTC', 'ETH')."""
@@ -228,8 +331,8 @@ class BinanceFeed:
 
     def get_price_history(self, symbol: str) -> list:
         """Get rolling price history (prices only) for symbol."""
-        buf = self.price_history_buffer.get(symbol, deque())
-        return [p for p, _ in buf]
+        buf = self.price_history_buffer.get(symbol)
+        return list(buf) if buf else []
 
     def get_window_open_price(self, symbol: str) -> Optional[float]:
         """Get the window open price for symbol."""
@@ -238,27 +341,41 @@ class BinanceFeed:
     async def get_funding_rate(self, symbol: str) -> float:
         """
         Fetch funding rate from Binance Futures API.
-        Cache for 5 minutes.
+        Cache for 5 minutes; up to 10 minutes old the stale rate is served while a background
+        refresh runs. Concurrent misses for a symbol share one request (per-symbol lock).
         """
-        now = time.time()
         cached = self._funding_cache.get(symbol)
         if cached:
             rate, ts = cached
-            if now - ts < FUNDING_CACHE_SECONDS:
+            age = time.monotonic() - ts
+            if age < FUNDING_CACHE_SECONDS:
                 return rate
-        if not self._session:
-            self._session = aiohttp.ClientSession()
-        try:
-            binance_sym = f"{symbol}USDT"
-            url = f"{BINANCE_FUTURES_FUNDING_URL}?symbol={binance_sym}"
-            async with self._session.get(url) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
-                rate = float(data.get("lastFundingRate", 0))
-                self._funding_cache[symbol] = (rate, now)
+            if age < 2 * FUNDING_CACHE_SECONDS:
+                refresh = self._funding_refreshes.get(symbol)
+                if refresh is None or refresh.done():
+                    self._funding_refreshes[symbol] = asyncio.create_task(self._refresh_funding_rate(symbol))
                 return rate
-        except Exception as e:
-            logger.warning(f"Funding rate fetch failed for {symbol}: {e}")
-            if cached:
+        return await self._refresh_funding_rate(symbol)
+
+    async def _refresh_funding_rate(self, symbol: str) -> float:
+        async with self._funding_locks[symbol]:
+            # Another caller may have refreshed while we waited on the lock
+            cached = self._funding_cache.get(symbol)
+            if cached and time.monotonic() - cached[1] < FUNDING_CACHE_SECONDS:
                 return cached[0]
-            return 0.0
+            if not self._session:
+                self._session = _new_session()
+            try:
+                binance_sym = f"{symbol}USDT"
+                url = f"{BINANCE_FUTURES_FUNDING_URL}?symbol={binance_sym}"
+                async with self._session.get(url) as resp:
+                    resp.raise_for_status()
+                    data = await resp.json()
+                    rate = float(data.get("lastFundingRate", 0))
+                    self._funding_cache[symbol] = (rate, time.monotonic())
+                    return rate
+            except Exception as e:
+                logger.warning(f"Funding rate fetch failed for {symbol}: {e}")
+                if cached:
+                    return cached[0]
+                return 0.0
@@ -5,19 +5,52 @@ Handles auth, request signing, and raw API calls.
 
 import asyncio
 import base64
-import hashlib
 import hmac
+import random
 import time
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlencode
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
+from yarl import URL
 from config import BotConfig
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # parses the raw body bytes directly; no decode-to-str step
+    _json_dumps = orjson.dumps  # -> bytes, spec-compliant JSON
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 logger = logging.getLogger("clob_client")
 
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15)
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def _new_session() -> aiohttp.ClientSession:
+    """Shared session for CLOB + Data API: long keepalive so polling reuses TCP/TLS connections."""
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=16,
+        keepalive_timeout=120,
+        ttl_dns_cache=300,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        timeout=REQUEST_TIMEOUT,
+    )
+
+
+def _read_json(body: bytes) -> Any:
+    # Mirrors resp.json(): an empty body decodes to None rather than raising
+    return _json_loads(body) if body.strip() else None
+
 
 class ClobClient:
     def __init__(self, config: BotConfig):
@@ -26,13 +59,14 @@ class ClobClient:
         self.data_api_url = "https://data-api.polymarket.com"
         self._session: Optional[aiohttp.ClientSession] = None
         self._closed = False
-        self._last_request_time = datetime.min
+        self._last_request_time = 0.0  # time.monotonic() of the last request
         self._request_delay = getattr(config, "CLOB_REQUEST_DELAY", 0.5)
+        self._auth_cache: Optional[tuple] = None  # (creds key, secret bytes, static headers)
 
     async def start(self):
         """Call once at bot startup — creates the shared session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = _new_session()
             logger.info("ClobClient session opened")
 
     async def close(self):
@@ -49,124 +83,129 @@ class ClobClient:
         if self._closed:
             raise RuntimeError("ClobClient is closed")
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = _new_session()
         return self._session
 
-    def _sign_request(self, method: str, path: str, body: str = "") -> Dict[str, str]:
-        """Generate CLOB API auth headers using HMAC-SHA256 (Polymarket L2 spec).
-        Timestamp must be UNIX seconds (matches py-clob-client and Polymarket docs).
+    def _auth_material(self) -> Tuple[bytes, Dict[str, str]]:
+        """Return (decoded secret, static auth headers), rebuilt only when creds change.
+        Credentials can be swapped at runtime (auth.ensure_clob_creds), so the cache is keyed on them.
         """
-        timestamp = str(int(time.time()))
-        message = str(timestamp) + method.upper() + path
-        if body:
-            message += str(body).replace("'", '"')
+        addr = getattr(self.config, "SIGNER_ADDRESS", None) or getattr(self.config, "PROXY_WALLET", None)
+        key = (self.config.API_KEY, self.config.API_SECRET, self.config.API_PASSPHRASE, addr)
+        if self._auth_cache is not None and self._auth_cache[0] == key:
+            return self._auth_cache[1], self._auth_cache[2]
         # Secret from Polymarket is base64-encoded; decode before HMAC
         try:
             secret_bytes = base64.urlsafe_b64decode(self.config.API_SECRET)
         except Exception as e:
             raise ValueError(f"Invalid POLY_API_SECRET (expected base64): {e}") from e
-        h = hmac.new(secret_bytes, message.encode("utf-8"), hashlib.sha256)
-        signature = base64.urlsafe_b64encode(h.digest()).decode("utf-8")
-        headers = {
+        static_headers = {
             "POLY-API-KEY": self.config.API_KEY,
             "POLY-PASSPHRASE": self.config.API_PASSPHRASE,
-            "POLY-TIMESTAMP": timestamp,
-            "POLY-SIGNATURE": signature,
             "Content-Type": "application/json",
         }
         # POLY-ADDRESS required for all L2 authenticated endpoints (Polymarket docs)
-        addr = getattr(self.config, "SIGNER_ADDRESS", None) or getattr(self.config, "PROXY_WALLET", None)
         if addr:
-            headers["POLY-ADDRESS"] = addr if addr.startswith("0x") else f"0x{addr}"
+            static_headers["POLY-ADDRESS"] = addr if addr.startswith("0x") else f"0x{addr}"
         else:
             logger.warning("POLY-ADDRESS missing — set POLY_ADDRESS env or PROXY_WALLET for authenticated requests")
-        return headers
+        self._auth_cache = (key, secret_bytes, static_headers)
+        return secret_bytes, static_headers
+
+    def _sign_request(self, method: str, path: str, body: bytes = b"") -> Dict[str, str]:
+        """Generate CLOB API auth headers using HMAC-SHA256 (Polymarket L2 spec).
+        Timestamp must be UNIX seconds (matches py-clob-client and Polymarket docs).
+        `method` must already be uppercase ("GET" / "POST"); `body` is the exact bytes sent.
+        """
+        timestamp = str(int(time.time()))
+        message = f"{timestamp}{method}{path}".encode("utf-8")
+        if body:
+            message += body
+        secret_bytes, static_headers = self._auth_material()
+        # One-shot OpenSSL HMAC — no intermediate hmac.HMAC object
+        digest = hmac.digest(secret_bytes, message, "sha256")
+        signature = base64.urlsafe_b64encode(digest).decode("utf-8")
+        return {**static_headers, "POLY-TIMESTAMP": timestamp, "POLY-SIGNATURE": signature}
 
     def _is_rate_limited(self, e: Exception) -> bool:
         s = str(e).lower()
         return "429" in s or "too many requests" in s
 
-    def _retry_delay(self, attempt: int, is_429: bool) -> float:
+    def _retry_delay(self, attempt: int, is_429: bool, retry_after: Optional[str] = None) -> float:
         if is_429:
+            # Server-specified wait wins when it's a plain number of seconds
+            if retry_after:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    pass
+            # Full jitter: spreads retries from bots sharing the limiter instead of syncing them
             base = getattr(self.config, "RETRY_429_DELAY_SECONDS", 5.0)
-            return base * (2 ** attempt)  # Exponential backoff for 429
+            return random.uniform(0, min(base * (2 ** attempt), MAX_BACKOFF_SECONDS))
         return self.config.RETRY_DELAY_SECONDS
 
-    async def _get(self, path: str, params: Optional[Dict] = None) -> Any:
-        # Rate limit gate — enforce minimum delay between requests
-        now = datetime.utcnow()
-        elapsed = (now - self._last_request_time).total_seconds()
+    async def _throttle(self):
+        """Rate limit gate — enforce minimum delay between requests (monotonic, immune to NTP steps)."""
+        elapsed = time.monotonic() - self._last_request_time
         if elapsed < self._request_delay:
             await asyncio.sleep(self._request_delay - elapsed)
-        self._last_request_time = datetime.utcnow()
+        self._last_request_time = time.monotonic()
 
-        # Path for HMAC must match request; include query string when params present
-        signed_path = path
-        if params and any(v for v in params.values()):
+    async def _get(self, path: str, params: Optional[Dict] = None) -> Any:
+        # Encode the query once and sign exactly what goes on the wire, so the HMAC can't
+        # drift from aiohttp's own params encoding (ordering / escaping of reserved chars).
+        url = URL(f"{self.base_url}{path}")
+        if params:
             filtered = {k: v for k, v in params.items() if v is not None and v != ""}
             if filtered:
-                signed_path = f"{path}?{urlencode(filtered)}"
-
-        session = self._get_session()
-        headers = self._sign_request("GET", signed_path)
-        url = f"{self.base_url}{path}"
-        max_attempts = self.config.RETRY_ATTEMPTS + 2  # Extra retries for 429
-        for attempt in range(max_attempts):
-            try:
-                async with session.get(url, headers=headers, params=params, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                    if resp.status == 429:
-                        await resp.read()  # Drain to release connection
-                        wait = int(resp.headers.get("Retry-After", 10))
-                        logger.warning(f"Rate limited on {path} — waiting {wait}s")
-                        await asyncio.sleep(wait)
-                        continue
-                    resp.raise_for_status()
-                    return await resp.json()
-            except aiohttp.ClientResponseError as e:
-                is_429 = e.status == 429
-                logger.warning(f"GET {path} attempt {attempt+1} failed: {e}")
-                if attempt < max_attempts - 1:
-                    delay = self._retry_delay(attempt, is_429)
-                    await asyncio.sleep(delay)
-                else:
-                    raise
-            except Exception as e:
-                is_429 = self._is_rate_limited(e)
-                logger.warning(f"GET {path} attempt {attempt+1} failed: {e}")
-                if attempt < max_attempts - 1:
-                    delay = self._retry_delay(attempt, is_429)
-                    await asyncio.sleep(delay)
-                else:
-                    raise
+                url = url.with_query(filtered)
+        query = url.raw_query_string
+        signed_path = f"{path}?{query}" if query else path
+        return await self._request("GET", path, signed_path, url)
+
+    async def _get_fast(self, path: str, query: str) -> Any:
+        """GET for fixed-shape endpoints whose query string is already URL-safe (hex/numeric ids).
+        Skips the filter + urlencode pass; the same string is signed and sent.
+        """
+        signed_path = f"{path}?{query}"
+        return await self._request("GET", path, signed_path, f"{self.base_url}{signed_path}")
 
     async def _post(self, path: str, body: Dict) -> Any:
-        import json
-        # Rate limit gate
-        now = datetime.utcnow()
-        elapsed = (now - self._last_request_time).total_seconds()
-        if elapsed < self._request_delay:
-            await asyncio.sleep(self._request_delay - elapsed)
-        self._last_request_time = datetime.utcnow()
-
+        # Serialized once: the same bytes are signed and written to the wire
+        body_bytes = _json_dumps(body)
+        return await self._request("POST", path, path, f"{self.base_url}{path}", data=body_bytes)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        signed_path: str,
+        url: Union[str, URL],
+        data: Optional[bytes] = None,
+    ) -> Any:
+        """Sign and send one CLOB request with 429-aware retries. Shared by _get/_get_fast/_post."""
+        await self._throttle()
         session = self._get_session()
-        body_str = json.dumps(body)
-        headers = self._sign_request("POST", path, body_str)
-        url = f"{self.base_url}{path}"
-        max_attempts = self.config.RETRY_ATTEMPTS + 2
+        body = data or b""
+        max_attempts = self.config.RETRY_ATTEMPTS + 2  # Extra retries for 429
         for attempt in range(max_attempts):
+            # Re-sign every attempt: after a long 429 backoff the original timestamp would be stale
+            headers = self._sign_request(method, signed_path, body)
             try:
-                async with session.post(url, headers=headers, data=body_str, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                async with session.request(method, url, headers=headers, data=data) as resp:
                     if resp.status == 429:
-                        await resp.read()  # Drain to release connection
-                        wait = int(resp.headers.get("Retry-After", 10))
-                        logger.warning(f"Rate limited on {path} — waiting {wait}s")
+                        # Drain so the keep-alive connection goes back to the pool; releasing
+                        # an unread body makes aiohttp close the socket instead.
+                        await resp.read()
+                        wait = self._retry_delay(attempt, True, resp.headers.get("Retry-After"))
+                        logger.warning(f"Rate limited on {path} — waiting {wait:.1f}s")
                         await asyncio.sleep(wait)
                         continue
                     resp.raise_for_status()
-                    return await resp.json()
+                    return _read_json(await resp.read())
             except aiohttp.ClientResponseError as e:
                 is_429 = e.status == 429
-                logger.warning(f"POST {path} attempt {attempt+1} failed: {e}")
+                logger.warning(f"{method} {path} attempt {attempt+1} failed: {e}")
                 if attempt < max_attempts - 1:
                     delay = self._retry_delay(attempt, is_429)
                     await asyncio.sleep(delay)
@@ -174,7 +213,7 @@ class ClobClient:
                     raise
             except Exception as e:
                 is_429 = self._is_rate_limited(e)
-                logger.warning(f"POST {path} attempt {attempt+1} failed: {e}")
+                logger.warning(f"{method} {path} attempt {attempt+1} failed: {e}")
                 if attempt < max_attempts - 1:
                     delay = self._retry_delay(attempt, is_429)
                     await asyncio.sleep(delay)
@@ -194,20 +233,19 @@ class ClobClient:
 
     async def get_order_book(self, token_id: str) -> Dict:
         """Fetch order book for a token."""
-        return await self._get(f"/book", params={"token_id": token_id})
+        return await self._get_fast("/book", f"token_id={token_id}")
 
     async def get_last_trade_price(self, token_id: str) -> Dict:
         """Get last traded price for a token."""
-        return await self._get(f"/last-trade-price", params={"token_id": token_id})
+        return await self._get_fast("/last-trade-price", f"token_id={token_id}")
 
     async def get_price_history(self, market_or_token_id: str, interval: str = "1m", fidelity: int = 60) -> Dict:
         """Get historical price/volume data. Pass condition_id (recommended) or token_id as market param."""
-        params = {
-            "market": market_or_token_id,
-            "interval": interval,
-            "fidelity": fidelity,
-        }
-        return await self._get("/prices-history", params=params)
+        # Free-form interval/market strings: encode through _get rather than _get_fast
+        return await self._get(
+            "/prices-history",
+            params={"market": market_or_token_id, "interval": interval, "fidelity": fidelity},
+        )
 
     # ── Order Management ──────────────────────────────────────────────────────
 
@@ -229,7 +267,7 @@ class ClobClient:
 
     async def get_open_orders(self) -> List[Dict]:
         """Get all open orders."""
-        result = await self._get("/orders", params={"state": "LIVE"})
+        result = await self._get_fast("/orders", "state=LIVE")
         return result.get("data", [])
 
     # ── Account ───────────────────────────────────────────────────────────────
@@ -252,7 +290,7 @@ class ClobClient:
         url = f"{self.data_api_url}/positions"
         params = {"user": wallet}
 
-        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+        async with session.get(url, params=params) as resp:
             resp.raise_for_status()
-            data = await resp.json()
+            data = _read_json(await resp.read())
             return data if isinstance(data, list) else data.get("data", [])
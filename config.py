@@ -4,113 +4,219 @@ Edit this file to control the bot's behavior.
 """
 
 import os
+import time
 
+# Deploy-time snapshot written by freeze_config.py (non-secret settings only). When present,
+# .env is only read for SECRET_ENV_KEYS; real environment variables still override the snapshot.
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    from config_frozen import FROZEN_ENV
 except ImportError:
-    pass
+    FROZEN_ENV = None
+
+# Never written to config_frozen.py — always taken from .env or the process environment
+SECRET_ENV_KEYS = frozenset({
+    "POLY_PRIVATE_KEY",
+    "POLY_API_KEY",
+    "POLY_API_SECRET",
+    "POLY_API_PASSPHRASE",
+    "REPORT_EMAIL_PASSWORD",
+    "DISCORD_WEBHOOK_URL",
+})
+
+# Parse .env once per process. Plain imports are already cached in sys.modules, but
+# importlib.reload(config) re-executes this body and keeps module globals — skip the re-parse then.
+# LOAD_DOTENV=0 skips python-dotenv entirely when the env is injected (systemd EnvironmentFile, Docker).
+if os.environ.get("LOAD_DOTENV", "1") == "1" and not globals().get("_DOTENV_LOADED"):
+    try:
+        from dotenv import dotenv_values, load_dotenv
+        if FROZEN_ENV is None:
+            load_dotenv()
+        else:
+            # Frozen: the snapshot has everything but the secrets, so only those come from .env
+            # (dashboard and manual runs have no EnvironmentFile to supply them)
+            for _key, _value in dotenv_values().items():
+                if _key in SECRET_ENV_KEYS and _value is not None:
+                    os.environ.setdefault(_key, _value)
+    except ImportError:
+        pass
+    _DOTENV_LOADED = True
 from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
+# One snapshot of the environment (after .env is applied), read by BotConfig.from_env().
+_ENV = {**(FROZEN_ENV or {}), **os.environ}
+_TRUTHY = frozenset({"true", "1", "yes"})
 
-@dataclass
-class BotConfig:
-    # ── Polymarket CLOB API ──────────────────────────────────────────────────
-    CLOB_API_URL: str = os.getenv("CLOB_API_URL", "https://clob.polymarket.com")
-    PRIVATE_KEY: str = os.getenv("POLY_PRIVATE_KEY", "")          # Wallet private key
-    PROXY_WALLET: Optional[str] = os.getenv("PROXY_WALLET")       # For positions lookup (Data API)
-    # POLY_ADDRESS (signer/funder): derived from PRIVATE_KEY, or set via env when using manual API keys
-    SIGNER_ADDRESS: Optional[str] = os.getenv("POLY_ADDRESS")     # Used for L2 auth header; derived if missing
-    API_KEY: str = os.getenv("POLY_API_KEY", "")                   # CLOB API key
-    API_SECRET: str = os.getenv("POLY_API_SECRET", "")
-    API_PASSPHRASE: str = os.getenv("POLY_API_PASSPHRASE", "")
-    CHAIN_ID: int = int(os.getenv("CHAIN_ID", "137"))              # 137 = Polygon mainnet
 
-    # ── Paper vs Live Trading ──────────────────────────────────────────────────
-    PAPER_TRADING: bool = os.getenv("PAPER_TRADING", "true").lower() in ("true", "1", "yes")
-    # When True: no real orders placed; simulates with paper balance. Use for testing.
-    # Set PAPER_TRADING=false to enable real money trading.
+def _parse_str(key: str, raw: str) -> str:
+    return raw
 
-    # ── Capital Management ───────────────────────────────────────────────────
-    BANKROLL: float = float(os.getenv("BANKROLL", "23.09"))        # Total capital in USDC (starting balance)
-    MAX_KELLY_FRACTION: float = 0.25   # Cap Kelly bet at 25% of full Kelly (safety)
-    MIN_BET_SIZE: float = float(os.getenv("MIN_BET_SIZE", "2.0"))   # Minimum order in USDC (scaled for $23 bankroll)
-    MAX_BET_SIZE: float = 5.0          # Hard cap per trade in USDC (scaled for $23 bankroll)
-    MAX_POSITION_SIZE_USD: float = float(os.getenv("MAX_POSITION_SIZE_USD", "5.0"))   # ~21% of bankroll per trade
-    MAX_POSITIONS: int = int(os.getenv("MAX_POSITIONS", "4"))       # 4 × $5 = $20 max exposure, within balance
-    MAX_PORTFOLIO_RISK: float = float(os.getenv("MAX_PORTFOLIO_RISK_PCT", "0.50"))  # 50% bankroll at risk across all positions
 
-    # ── Daily Goal & Risk Limits ─────────────────────────────────────────────
-    DAILY_PROFIT_GOAL_USD: float = float(os.getenv("DAILY_PROFIT_GOAL_USD", "5.0"))   # ~22% daily return target on $23 bankroll
-    DAILY_LOSS_LIMIT_PCT: float = 0.20  # Hard stop: pause all trading if daily loss >= 20% bankroll
-    RESET_DAILY_LOSS_PAUSE: bool = os.getenv("RESET_DAILY_LOSS_PAUSE", "false").lower() in ("true", "1", "yes")
-    PER_TRADE_MAX_LOSS_PCT: float = 0.10  # Max 10% of bankroll per trade (caps position size)
-    MAX_TRADES_PER_HOUR: int = int(os.getenv("MAX_TRADES_PER_HOUR", "20"))  # Rate limit; set higher to allow more
-    LOSS_STREAK_REQUIRE_HIGHER_EDGE: int = 2   # After N consecutive losses, require +2% edge
-    POSITION_SIZING_MODE: str = os.getenv("POSITION_SIZING_MODE", "fractional_kelly")  # kelly | fractional_kelly | bankroll_pct
-    KELLY_FRACTION: float = float(os.getenv("KELLY_FRACTION", "0.25"))  # 0.25 = quarter-Kelly (conservative sizing)
+def _parse_lower(key: str, raw: str) -> str:
+    return raw.lower()
+
+
+def _parse_float(key: str, raw: str) -> float:
+    try:
+        return float(raw)
+    except ValueError:
+        raise ValueError(f"Invalid {key}={raw!r} (expected a number)") from None
+
+
+def _parse_int(key: str, raw: str) -> int:
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"Invalid {key}={raw!r} (expected an integer)") from None
 
+
+def _parse_bool(key: str, raw: str) -> bool:
+    return raw.lower() in _TRUTHY
+
+
+class SizingMode(str, Enum):
+    KELLY = "kelly"
+    FRACTIONAL_KELLY = "fractional_kelly"
+    BANKROLL_PCT = "bankroll_pct"
+
+
+class OrderType(str, Enum):
+    GTC = "GTC"  # Good Till Cancelled
+    FOK = "FOK"  # Fill Or Kill
+
+
+def _enum_parser(enum_cls):
+    """Parse an enum setting once so hot paths compare members by identity, not strings."""
+    def parse(key: str, raw: str):
+        wanted = raw.strip().lower()
+        for member in enum_cls:
+            if member.value.lower() == wanted:
+                return member
+        allowed = ", ".join(m.value for m in enum_cls)
+        raise ValueError(f"Invalid {key}={raw!r} (expected one of: {allowed})")
+    return parse
+
+
+@dataclass(slots=True)
+class CatalystState:
+    """Runtime XRP catalyst flag (set from catalyst_flag.json). Kept out of BotConfig so the
+    config holds only settings; expiry length and boost stay there as XRP_CATALYST_*."""
+    active: bool = False
+    direction: str = "UP"               # "UP" or "DOWN"
+    set_epoch: Optional[float] = None   # time.time() when the flag was set
+
+    def activate(self, direction: str = "UP") -> None:
+        """Turn the catalyst on; it auto-expires XRP_CATALYST_EXPIRY_MINUTES from now."""
+        self.active = True
+        self.direction = direction.upper()
+        self.set_epoch = time.time()
+
+
+# Process-wide catalyst flag shared by the catalyst watcher and the edge filter
+CATALYST_STATE = CatalystState()
+
+
+# slots=True: fields live in fixed slots (no per-instance __dict__), so the per-tick config
+# reads are slot loads. Not frozen — derived creds and tests assign fields at runtime.
+@dataclass(slots=True)
+class BotConfig:
+    # Hot fields first: the edge filter and position monitor read these per market per tick,
+    # so declaring them first keeps their slots adjacent at the front of the instance.
     # ── Edge Filter (core profit gate) ──────────────────────────────────────
-    MIN_EDGE_SIGNALS: int = int(os.getenv("MIN_EDGE_SIGNALS", "3"))  # Require 3 of 4 signals (reverted from 2)
+    MIN_EDGE_SIGNALS: int = 3  # Require 3 of 4 signals (reverted from 2)
                                        # Signals: OB imbalance, momentum, volume, Kelly
-    MIN_KELLY_EDGE: float = float(os.getenv("MIN_KELLY_EDGE", "0.02"))  # 2% Kelly edge (more trades)
-    MIN_EDGE_PCT: float = float(os.getenv("MIN_EDGE_PCT", "0.02"))  # 2% min edge
+    MIN_KELLY_EDGE: float = 0.02  # 2% Kelly edge (more trades)
+    MIN_EDGE_PCT: float = 0.02  # 2% min edge
     MIN_LIQUIDITY_USDC: float = 500.0  # Market must have at least $500 in order book
-    MIN_MARKET_VOLUME_USD: float = float(os.getenv("MIN_MARKET_VOLUME_USD", "500.0"))  # $500 min (was 1000)
+    MIN_MARKET_VOLUME_USD: float = 500.0  # $500 min (was 1000)
     BASE_KELLY_BOOST: float = 0.03     # Default edge boost (conservative; was 0.08 which inflated sizing)
     MAX_SPREAD_CENTS: float = 0.08     # Max bid-ask spread (8¢) to avoid illiquid markets
 
     # ── Order Book Imbalance ─────────────────────────────────────────────────
-    OB_IMBALANCE_THRESHOLD: float = float(os.getenv("OB_IMBALANCE_THRESHOLD", "0.55"))  # 55% = genuine dominance (was 0.52)
+    OB_IMBALANCE_THRESHOLD: float = 0.55  # 55% = genuine dominance (was 0.52)
     OB_DEPTH_LEVELS: int = 5               # How many price levels to analyze
+    OB_LEVEL_DECAY: float = 0.0            # >0 = weight level i by exp(-i*decay); 0 = flat top-N sum
 
     # ── Momentum / Price Velocity ─────────────────────────────────────────────
-    MOMENTUM_WINDOW: int = int(os.getenv("MOMENTUM_WINDOW", "5"))  # 5 ticks (15-min has sparse history)
-    MOMENTUM_MIN_MOVE: float = float(os.getenv("MOMENTUM_MIN_MOVE", "0.012"))  # 1.2% move (was 1.0%)
-    MOMENTUM_DIRECTION_CONSISTENCY: float = float(os.getenv("MOMENTUM_CONSISTENCY", "0.70"))  # 70% ticks same direction (was 60%)
+    MOMENTUM_WINDOW: int = 5  # 5 ticks (15-min has sparse history)
+    MOMENTUM_MIN_MOVE: float = 0.012  # 1.2% move (was 1.0%)
+    MOMENTUM_DIRECTION_CONSISTENCY: float = 0.70  # 70% ticks same direction (was 60%)
 
     # ── Volume Spike Detection ───────────────────────────────────────────────
-    VOLUME_SPIKE_MULTIPLIER: float = float(os.getenv("VOLUME_SPIKE_MULTIPLIER", "2.0"))  # 2.0x baseline = genuine spike (was 1.5x)
-    VOLUME_ROLLING_WINDOW: int = int(os.getenv("VOLUME_ROLLING_WINDOW", "10"))  # 10 ticks (15-min markets sparse)
+    VOLUME_SPIKE_MULTIPLIER: float = 2.0  # 2.0x baseline = genuine spike (was 1.5x)
+    VOLUME_ROLLING_WINDOW: int = 10  # 10 ticks (15-min markets sparse)
+
+    # ── Position Management ───────────────────────────────────────────────────
+    TAKE_PROFIT_MULTIPLIER: float = 1.35   # Exit when price hits 1.35x entry (35% profit); was 1.8x which almost never hit in 15-min markets
+    STOP_LOSS_PCT: float = 0.15  # 15% drop from entry (e.g. 0.40->0.34)
+    EMERGENCY_STOP_PCT: float = 0.40  # -40% hard stop, ignores min hold
+    MIN_HOLD_SECONDS: int = 30  # Ignore stop loss for first 30s
+    CLOSE_ON_RESTART: bool = False
+    TIME_STOP_BUFFER_SECONDS: int = 45     # Force-exit 45s before market resolves (was 90s; final minute is highest-volatility)
+    POLL_POSITIONS_INTERVAL: int = 15      # Check open positions every 15 seconds
+
+    # ── Polymarket CLOB API ──────────────────────────────────────────────────
+    CLOB_API_URL: str = "https://clob.polymarket.com"
+    PRIVATE_KEY: str = ""          # Wallet private key
+    PROXY_WALLET: Optional[str] = None       # For positions lookup (Data API)
+    # POLY_ADDRESS (signer/funder): derived from PRIVATE_KEY, or set via env when using manual API keys
+    SIGNER_ADDRESS: Optional[str] = None     # Used for L2 auth header; derived if missing
+    API_KEY: str = ""                   # CLOB API key
+    API_SECRET: str = ""
+    API_PASSPHRASE: str = ""
+    CHAIN_ID: int = 137              # 137 = Polygon mainnet
+
+    # ── Paper vs Live Trading ──────────────────────────────────────────────────
+    PAPER_TRADING: bool = True
+    # When True: no real orders placed; simulates with paper balance. Use for testing.
+    # Set PAPER_TRADING=false to enable real money trading.
+
+    # ── Capital Management ───────────────────────────────────────────────────
+    BANKROLL: float = 23.09        # Total capital in USDC (starting balance)
+    MIN_BET_SIZE: float = 2.0   # Minimum order in USDC (scaled for $23 bankroll)
+    MAX_POSITION_SIZE_USD: float = 5.0   # ~21% of bankroll per trade
+    MAX_POSITIONS: int = 4       # 4 × $5 = $20 max exposure, within balance
+    MAX_PORTFOLIO_RISK: float = 0.50  # 50% bankroll at risk across all positions
+
+    # ── Daily Goal & Risk Limits ─────────────────────────────────────────────
+    DAILY_PROFIT_GOAL_USD: float = 5.0   # ~22% daily return target on $23 bankroll
+    DAILY_LOSS_LIMIT_PCT: float = 0.20  # Hard stop: pause all trading if daily loss >= 20% bankroll
+    RESET_DAILY_LOSS_PAUSE: bool = False
+    PER_TRADE_MAX_LOSS_PCT: float = 0.10  # Max 10% of bankroll per trade (caps position size)
+    MAX_TRADES_PER_HOUR: int = 20  # Rate limit; set higher to allow more
+    LOSS_STREAK_REQUIRE_HIGHER_EDGE: int = 2   # After N consecutive losses, require +2% edge
+    POSITION_SIZING_MODE: SizingMode = SizingMode.FRACTIONAL_KELLY  # kelly | fractional_kelly | bankroll_pct
+    KELLY_FRACTION: float = 0.25  # 0.25 = quarter-Kelly (conservative sizing)
 
     # ── Execution ────────────────────────────────────────────────────────────
-    ORDER_TYPE: str = "GTC"            # GTC = Good Till Cancelled, FOK = Fill Or Kill
+    ORDER_TYPE: OrderType = OrderType.GTC  # GTC = Good Till Cancelled, FOK = Fill Or Kill
     SLIPPAGE_TOLERANCE: float = 0.02   # Max 2% slippage from mid price
     RETRY_ATTEMPTS: int = 3
     RETRY_DELAY_SECONDS: float = 1.0
     RETRY_429_DELAY_SECONDS: float = 5.0   # Longer backoff for rate limit (429)
     CLOB_PAGINATION_DELAY_SECONDS: float = 0.5   # Min delay between paginated requests
-    CLOB_REQUEST_DELAY: float = float(os.getenv("CLOB_REQUEST_DELAY", "0.5"))  # 500ms between all CLOB requests
-
-    # ── Position Management ───────────────────────────────────────────────────
-    TAKE_PROFIT_MULTIPLIER: float = 1.35   # Exit when price hits 1.35x entry (35% profit); was 1.8x which almost never hit in 15-min markets
-    STOP_LOSS_THRESHOLD: float = 0.35      # Legacy: fixed price (ignored if STOP_LOSS_PCT set)
-    STOP_LOSS_PCT: float = float(os.getenv("STOP_LOSS_PCT", "0.15"))  # 15% drop from entry (e.g. 0.40->0.34)
-    EMERGENCY_STOP_PCT: float = float(os.getenv("EMERGENCY_STOP_PCT", "0.40"))  # -40% hard stop, ignores min hold
-    MIN_HOLD_SECONDS: int = int(os.getenv("MIN_HOLD_SECONDS", "30"))  # Ignore stop loss for first 30s
-    CLOSE_ON_RESTART: bool = os.getenv("CLOSE_ON_RESTART", "false").lower() in ("true", "1", "yes")
-    TIME_STOP_BUFFER_SECONDS: int = 45     # Force-exit 45s before market resolves (was 90s; final minute is highest-volatility)
-    POLL_POSITIONS_INTERVAL: int = 15      # Check open positions every 15 seconds
+    CLOB_REQUEST_DELAY: float = 0.5  # 500ms between all CLOB requests
 
     # ── Orphan / Maker reconciliation ────────────────────────────────────────
     ORPHAN_RECONCILE_INTERVAL_SECONDS: int = 120  # Reconcile CLOB positions every 2 min
 
     # ── Scanner ───────────────────────────────────────────────────────────────
-    SCAN_INTERVAL_SECONDS: int = int(os.getenv("SCAN_INTERVAL_SECONDS", "30"))  # Re-scan interval (30s default)
+    SCAN_INTERVAL_SECONDS: int = 30  # Re-scan interval (30s default)
     MARKET_MIN_TIME_REMAINING: int = 60     # Only enter if ≥1 minute left
     MARKET_MAX_TIME_REMAINING: int = 900    # 15 min max for slug discovery; tag fallback uses 90 days
 
     # ── Logging ───────────────────────────────────────────────────────────────
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE: Optional[str] = os.getenv("LOG_FILE", "bot.log")
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE: Optional[str] = "bot.log"
     TRADE_LOG_FILE: str = "trades.csv"
 
     # ── Dry Run (testing) ─────────────────────────────────────────────────────
-    DRY_RUN: bool = os.getenv("DRY_RUN", "true").lower() in ("true", "1", "yes")
+    DRY_RUN: bool = True
 
     # ── Price Feed (Binance geo-restricted in some regions; use CoinGecko fallback) ─
-    PRICE_FEED_SOURCE: str = os.getenv("PRICE_FEED_SOURCE", "binance")  # "binance" | "coingecko"
+    PRICE_FEED_SOURCE: str = "binance"  # "binance" | "coingecko"
 
     # ── Strategy 1: BTC Momentum Carry ───────────────────────────────────────────
     BTC_MOMENTUM_THRESHOLD: float = 0.003      # 0.3% move required
@@ -118,7 +224,7 @@ class BotConfig:
     BTC_MOMENTUM_WINDOW_MINUTES: int = 5       # Window open price lookback
     ACTIVE_HOURS_START: int = 9                # 9 AM ET
     ACTIVE_HOURS_END: int = 16                 # 4 PM ET
-    ACTIVE_HOURS_ENABLED: bool = os.getenv("ACTIVE_HOURS_ENABLED", "false").lower() in ("true", "1", "yes")
+    ACTIVE_HOURS_ENABLED: bool = False
 
     # ── Strategy 2: ETH Lag Trade ─────────────────────────────────────────────────
     ETH_LAG_EXPIRY_SECONDS: int = 45          # How long BTC signal stays valid for ETH entry (was 90s; stale signals lose money)
@@ -142,19 +248,125 @@ class BotConfig:
     MAKER_VOLATILITY_KILL: float = 0.008        # Cancel maker orders if price moves 0.8% suddenly
 
     # ── Strategy 5: XRP Catalyst ──────────────────────────────────────────────────
-    XRP_REQUIRE_CATALYST: bool = os.getenv("XRP_REQUIRE_CATALYST", "false").lower() in ("true", "1", "yes")
-    XRP_CATALYST_ACTIVE: bool = False
-    XRP_CATALYST_DIRECTION: str = "UP"          # "UP" or "DOWN"
+    XRP_REQUIRE_CATALYST: bool = False
     XRP_CATALYST_EXPIRY_MINUTES: int = 60       # Auto-expire catalyst flag after 60 minutes
-    XRP_CATALYST_SET_TIME: Optional[str] = None # ISO timestamp when flag was set
     XRP_CATALYST_SIGNAL_BOOST: float = 0.18     # Maximum Kelly boost for catalyst trades
-    XRP_NO_CATALYST_MIN_SIGNALS: int = int(os.getenv("XRP_MIN_SIGNALS", "2"))  # 2 signals when no catalyst
-
-    # ── Daily/Weekly Reports ───────────────────────────────────────────────────────
-    DAILY_REPORT_ENABLED: bool = os.getenv("DAILY_REPORT_ENABLED", "true").lower() in ("true", "1", "yes")
-    REPORT_EMAIL_TO: str = os.getenv("REPORT_EMAIL_TO", "")
-    REPORT_EMAIL_FROM: str = os.getenv("REPORT_EMAIL_FROM", "")
-    REPORT_EMAIL_PASSWORD: str = os.getenv("REPORT_EMAIL_PASSWORD", "")
-    REPORT_SEND_TIME_UTC: str = os.getenv("REPORT_SEND_TIME_UTC", "23:59")  # HH:MM
-    DISCORD_WEBHOOK_URL: str = os.getenv("DISCORD_WEBHOOK_URL", "")
-    WEEKLY_REPORT_DAY: str = os.getenv("WEEKLY_REPORT_DAY", "sunday").lower()
+    XRP_NO_CATALYST_MIN_SIGNALS: int = 2  # 2 signals when no catalyst
+
+    # ── Daily/Weekly Reports (delivery settings live in ReportConfig) ─────────────
+    DAILY_REPORT_ENABLED: bool = True
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def from_env(cls) -> "BotConfig":
+        """The process-wide config: env overrides parsed once, then cached.
+        Plain BotConfig() gives the literal defaults (what the tests build on).
+        """
+        overrides = {}
+        for name, (env_key, parse) in _ENV_FIELDS.items():
+            raw = _ENV.get(env_key)
+            if raw is not None:
+                overrides[name] = parse(env_key, raw)
+        return cls(**overrides)
+
+    @property
+    def MIN_TRADE_EDGE(self) -> float:
+        """Edge gate for a trade: the stricter of MIN_KELLY_EDGE and MIN_EDGE_PCT (follows later edits)."""
+        return max(self.MIN_KELLY_EDGE, self.MIN_EDGE_PCT)
+
+    @property
+    def report(self) -> Optional["ReportConfig"]:
+        """Report delivery settings, read from the env on first use; None when reports are off."""
+        return ReportConfig.from_env() if self.DAILY_REPORT_ENABLED else None
+
+
+@dataclass(slots=True)
+class ReportConfig:
+    """Email/Discord report settings. Kept out of BotConfig so the credentials are only parsed
+    when a report is actually scheduled (BotConfig.report) or generated (daily_report)."""
+    REPORT_EMAIL_TO: str = ""
+    REPORT_EMAIL_FROM: str = ""
+    REPORT_EMAIL_PASSWORD: str = ""
+    REPORT_SEND_TIME_UTC: str = "23:59"  # HH:MM
+    DISCORD_WEBHOOK_URL: str = ""
+    WEEKLY_REPORT_DAY: str = "sunday"
+    # Derived: REPORT_SEND_TIME_UTC as minutes past midnight, so the scheduler compares ints
+    REPORT_SEND_MINUTE_OF_DAY: int = field(init=False, default=23 * 60 + 59)
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def from_env(cls) -> "ReportConfig":
+        overrides = {}
+        for name, (env_key, parse) in _REPORT_ENV_FIELDS.items():
+            raw = _ENV.get(env_key)
+            if raw is not None:
+                overrides[name] = parse(env_key, raw)
+        return cls(**overrides)
+
+    def __post_init__(self):
+        try:
+            parts = (self.REPORT_SEND_TIME_UTC or "23:59").replace(":", " ").split()
+            h = int(parts[0]) if parts else 23
+            m = int(parts[1]) if len(parts) > 1 else 59
+        except ValueError:
+            h, m = 23, 59
+        self.REPORT_SEND_MINUTE_OF_DAY = h * 60 + m
+
+
+# Field name -> (env var, parser). Only fields listed here can be overridden from the environment.
+_ENV_FIELDS = {
+    "MIN_EDGE_SIGNALS":               ("MIN_EDGE_SIGNALS", _parse_int),
+    "MIN_KELLY_EDGE":                 ("MIN_KELLY_EDGE", _parse_float),
+    "MIN_EDGE_PCT":                   ("MIN_EDGE_PCT", _parse_float),
+    "MIN_MARKET_VOLUME_USD":          ("MIN_MARKET_VOLUME_USD", _parse_float),
+    "OB_IMBALANCE_THRESHOLD":         ("OB_IMBALANCE_THRESHOLD", _parse_float),
+    "OB_LEVEL_DECAY":                 ("OB_LEVEL_DECAY", _parse_float),
+    "MOMENTUM_WINDOW":                ("MOMENTUM_WINDOW", _parse_int),
+    "MOMENTUM_MIN_MOVE":              ("MOMENTUM_MIN_MOVE", _parse_float),
+    "MOMENTUM_DIRECTION_CONSISTENCY": ("MOMENTUM_CONSISTENCY", _parse_float),
+    "VOLUME_SPIKE_MULTIPLIER":        ("VOLUME_SPIKE_MULTIPLIER", _parse_float),
+    "VOLUME_ROLLING_WINDOW":          ("VOLUME_ROLLING_WINDOW", _parse_int),
+    "STOP_LOSS_PCT":                  ("STOP_LOSS_PCT", _parse_float),
+    "EMERGENCY_STOP_PCT":             ("EMERGENCY_STOP_PCT", _parse_float),
+    "MIN_HOLD_SECONDS":               ("MIN_HOLD_SECONDS", _parse_int),
+    "CLOSE_ON_RESTART":               ("CLOSE_ON_RESTART", _parse_bool),
+    "CLOB_API_URL":                   ("CLOB_API_URL", _parse_str),
+    "PRIVATE_KEY":                    ("POLY_PRIVATE_KEY", _parse_str),
+    "PROXY_WALLET":                   ("PROXY_WALLET", _parse_str),
+    "SIGNER_ADDRESS":                 ("POLY_ADDRESS", _parse_str),
+    "API_KEY":                        ("POLY_API_KEY", _parse_str),
+    "API_SECRET":                     ("POLY_API_SECRET", _parse_str),
+    "API_PASSPHRASE":                 ("POLY_API_PASSPHRASE", _parse_str),
+    "CHAIN_ID":                       ("CHAIN_ID", _parse_int),
+    "PAPER_TRADING":                  ("PAPER_TRADING", _parse_bool),
+    "BANKROLL":                       ("BANKROLL", _parse_float),
+    "MIN_BET_SIZE":                   ("MIN_BET_SIZE", _parse_float),
+    "MAX_POSITION_SIZE_USD":          ("MAX_POSITION_SIZE_USD", _parse_float),
+    "MAX_POSITIONS":                  ("MAX_POSITIONS", _parse_int),
+    "MAX_PORTFOLIO_RISK":             ("MAX_PORTFOLIO_RISK_PCT", _parse_float),
+    "DAILY_PROFIT_GOAL_USD":          ("DAILY_PROFIT_GOAL_USD", _parse_float),
+    "RESET_DAILY_LOSS_PAUSE":         ("RESET_DAILY_LOSS_PAUSE", _parse_bool),
+    "MAX_TRADES_PER_HOUR":            ("MAX_TRADES_PER_HOUR", _parse_int),
+    "POSITION_SIZING_MODE":           ("POSITION_SIZING_MODE", _enum_parser(SizingMode)),
+    "KELLY_FRACTION":                 ("KELLY_FRACTION", _parse_float),
+    "CLOB_REQUEST_DELAY":             ("CLOB_REQUEST_DELAY", _parse_float),
+    "SCAN_INTERVAL_SECONDS":          ("SCAN_INTERVAL_SECONDS", _parse_int),
+    "LOG_LEVEL":                      ("LOG_LEVEL", _parse_str),
+    "LOG_FILE":                       ("LOG_FILE", _parse_str),
+    "DRY_RUN":                        ("DRY_RUN", _parse_bool),
+    "PRICE_FEED_SOURCE":              ("PRICE_FEED_SOURCE", _parse_str),
+    "ACTIVE_HOURS_ENABLED":           ("ACTIVE_HOURS_ENABLED", _parse_bool),
+    "XRP_REQUIRE_CATALYST":           ("XRP_REQUIRE_CATALYST", _parse_bool),
+    "XRP_NO_CATALYST_MIN_SIGNALS":    ("XRP_MIN_SIGNALS", _parse_int),
+    "DAILY_REPORT_ENABLED":           ("DAILY_REPORT_ENABLED", _parse_bool),
+}
+
+# Same shape as _ENV_FIELDS, for ReportConfig.from_env()
+_REPORT_ENV_FIELDS = {
+    "REPORT_EMAIL_TO":                ("REPORT_EMAIL_TO", _parse_str),
+    "REPORT_EMAIL_FROM":              ("REPORT_EMAIL_FROM", _parse_str),
+    "REPORT_EMAIL_PASSWORD":          ("REPORT_EMAIL_PASSWORD", _parse_str),
+    "REPORT_SEND_TIME_UTC":           ("REPORT_SEND_TIME_UTC", _parse_str),
+    "DISCORD_WEBHOOK_URL":            ("DISCORD_WEBHOOK_URL", _parse_str),
+    "WEEKLY_REPORT_DAY":              ("WEEKLY_REPORT_DAY", _parse_lower),
+}
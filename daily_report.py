@@ -3,17 +3,40 @@ daily_report.py — Generates and delivers daily and weekly trading reports.
 Runs at 11:59 PM UTC via scheduler in main.py. Also callable via /api/generate-report.
 """
 
+import asyncio
 import csv
 import json
 import os
+import re
 import smtplib
 import logging
+import time
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from operator import attrgetter
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # reads the file bytes directly
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None, default=str).encode("utf-8")
 
 logger = logging.getLogger("daily_report")
 
@@ -22,6 +45,9 @@ REPORTS_DIR = BASE_DIR / "reports"
 TRADES_CSV = BASE_DIR / "trades.csv"
 STATE_FILE = BASE_DIR / "bot_state.json"
 SESSION_START_FILE = BASE_DIR / "session_start.json"
+TRADES_READ_BUFFER = 1 << 20  # 1 MB reads for trades.csv
+TRADES_CACHE_SUFFIX = ".parsed.json"  # trades.csv -> trades.parsed.json (parsed Trade rows as plain lists)
+TRADES_CACHE_VERSION = 1  # Bump when Trade's fields or the CSV decode change; older caches are re-parsed
 
 # Strategy display names for reports
 STRATEGY_DISPLAY = {
@@ -35,50 +61,178 @@ STRATEGY_DISPLAY = {
 }
 
 
-def _load_config() -> dict:
-    """Load report-related config from env."""
-    def _get(k: str, default: Any = None) -> Any:
-        v = os.getenv(k)
-        if v is None or v == "":
-            return default
-        if isinstance(default, bool):
-            return v.lower() in ("true", "1", "yes")
-        if isinstance(default, int):
-            try:
-                return int(v)
-            except ValueError:
-                return default
-        return v
+class Trade(NamedTuple):
+    """One closed-trade row from trades.csv, parsed once so report code never re-parses strings."""
+    exit_time: str
+    exit_date: str    # exit_time[:10] (YYYY-MM-DD), "" when missing
+    pnl: float        # 0.0 when pnl_usdc is blank
+    closed: bool      # pnl_usdc was filled in
+    strategy: str     # stripped, "OTHER" when blank
+    question: str
+    size: float
+    is_nba: bool
 
-    return {
-        "daily_report_enabled": _get("DAILY_REPORT_ENABLED", True),
-        "report_email_to": _get("REPORT_EMAIL_TO", ""),
-        "report_email_from": _get("REPORT_EMAIL_FROM", ""),
-        "report_email_password": _get("REPORT_EMAIL_PASSWORD", ""),
-        "report_send_time_utc": _get("REPORT_SEND_TIME_UTC", "23:59"),
-        "discord_webhook_url": _get("DISCORD_WEBHOOK_URL", ""),
-        "weekly_report_day": _get("WEEKLY_REPORT_DAY", "sunday").lower(),
-    }
+
+def _to_float(v: Optional[str]) -> float:
+    try:
+        return float(v) if v else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _parse_trade(exit_time: str, pnl_raw: str, strategy: str, question: str, size_raw: str) -> Trade:
+    pnl_raw = pnl_raw.strip()
+    return Trade(
+        exit_time=exit_time,
+        exit_date=exit_time[:10],
+        pnl=_to_float(pnl_raw),
+        closed=bool(pnl_raw),
+        strategy=strategy.strip() or "OTHER",
+        question=question,
+        size=_to_float(size_raw),
+        is_nba=_is_nba_market(question),
+    )
+
+
+_trades_cache: Optional[tuple] = None   # ((path, mtime_ns, size), [Trade, ...])
+_by_date_cache: Optional[tuple] = None  # ((path, mtime_ns, size), {exit_date: [Trade, ...]})
 
 
-def _read_trades() -> List[dict]:
-    """Read all trades from trades.csv."""
+@lru_cache(maxsize=1)
+def _bot_config():
+    """The bot's BotConfig, or None when config.py can't be loaded (report run standalone)."""
     try:
         from config import BotConfig
-        path = Path(BotConfig().TRADE_LOG_FILE)
+        return BotConfig.from_env()
     except Exception:
-        path = TRADES_CSV
-    if not path.exists():
-        return []
+        return None
+
+
+@lru_cache(maxsize=1)
+def _report_config():
+    """ReportConfig from config.py (frozen snapshot + env), or None when config.py can't be loaded."""
+    try:
+        from config import ReportConfig
+        return ReportConfig.from_env()
+    except Exception:
+        return None
+
+
+def _load_config() -> dict:
+    """Report delivery settings as the dict send_email/send_discord take. Delivery does not depend
+    on DAILY_REPORT_ENABLED — that flag only gates the scheduler, so manual runs still send."""
+    cfg = _bot_config()
+    report_cfg = _report_config()
+    if report_cfg is None:
+        return {"daily_report_enabled": bool(cfg and cfg.DAILY_REPORT_ENABLED)}
+    return {
+        "daily_report_enabled": bool(cfg and cfg.DAILY_REPORT_ENABLED),
+        "report_email_to": report_cfg.REPORT_EMAIL_TO,
+        "report_email_from": report_cfg.REPORT_EMAIL_FROM,
+        "report_email_password": report_cfg.REPORT_EMAIL_PASSWORD,
+        "report_send_time_utc": report_cfg.REPORT_SEND_TIME_UTC,
+        "discord_webhook_url": report_cfg.DISCORD_WEBHOOK_URL,
+        "weekly_report_day": report_cfg.WEEKLY_REPORT_DAY,
+    }
+
+
+def _trades_path() -> Path:
+    cfg = _bot_config()
+    return Path(cfg.TRADE_LOG_FILE) if cfg else TRADES_CSV
+
+
+def _trades_key(path: Path) -> Optional[tuple]:
+    """Cache key for the parsed trade log: (path, mtime_ns, size), or None if there is no file."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _trades_by_date() -> Dict[str, List[Trade]]:
+    """Trades grouped by exit date (YYYY-MM-DD), built once per version of trades.csv."""
+    global _by_date_cache
+    key = _trades_key(_trades_path())
+    if key is None:
+        return {}
+    if _by_date_cache is None or _by_date_cache[0] != key:
+        by_date = defaultdict(list)
+        for t in _iter_trades():
+            if t.exit_date:
+                by_date[t.exit_date].append(t)
+        _by_date_cache = (key, dict(by_date))
+    return _by_date_cache[1]
+
+
+def _iter_trades() -> Iterator[Trade]:
+    """Yield trades from trades.csv. Parsed rows are cached (in memory and as plain JSON rows next
+    to the CSV) keyed on the CSV's mtime and size, so an unchanged log is never re-parsed."""
+    global _trades_cache
+    path = _trades_path()
+    key = _trades_key(path)
+    if key is None:
+        return
+    if _trades_cache is not None and _trades_cache[0] == key:
+        yield from _trades_cache[1]
+        return
+    cache_path = path.with_suffix(TRADES_CACHE_SUFFIX)
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+        if cached.get("version") == TRADES_CACHE_VERSION and tuple(cached["key"]) == key:
+            trades = [Trade(*row) for row in cached["rows"]]
+            _trades_cache = (key, trades)
+            yield from trades
+            return
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring trade cache {cache_path.name}: {e}")
+
     trades = []
     try:
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                trades.append(dict(row))
+        for t in _parse_trades_csv(path):
+            trades.append(t)
+            yield t
     except Exception as e:
         logger.warning(f"Could not read trades: {e}")
-    return trades
+        return  # Partial parse: serve what was read, cache nothing
+    _trades_cache = (key, trades)
+    # Only a parse that ran to completion is persisted, and via a temp file + rename so a
+    # reader never sees a half-written cache
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(_json_dumps({
+            "version": TRADES_CACHE_VERSION,
+            "key": list(key),
+            "rows": [list(t) for t in trades],
+        }))
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug(f"Could not write trade cache: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _parse_trades_csv(path: Path) -> Iterator[Trade]:
+    """Yield trades from trades.csv as they are parsed (no list of the whole file).
+    Read errors propagate so _iter_trades never caches a partial parse."""
+    with open(path, newline="", encoding="utf-8", buffering=TRADES_READ_BUFFER) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        # Positional decode (no dict per row). Short rows are padded with "", and a column
+        # missing from an older header points at that padding.
+        width = len(header) + 1
+        col = {name: i for i, name in enumerate(header)}
+        et_i, pnl_i, strat_i, q_i, size_i = (
+            col.get(name, width - 1)
+            for name in ("exit_time", "pnl_usdc", "strategy", "question", "size_usdc")
+        )
+        for row in reader:
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            yield _parse_trade(row[et_i], row[pnl_i], row[strat_i], row[q_i], row[size_i])
 
 
 def _read_state() -> dict:
@@ -86,8 +240,7 @@ def _read_state() -> dict:
     if not STATE_FILE.exists():
         return {}
     try:
-        with open(STATE_FILE, encoding="utf-8") as f:
-            return json.load(f)
+        return _json_loads(STATE_FILE.read_bytes())
     except Exception:
         return {}
 
@@ -97,198 +250,267 @@ def _read_session_start() -> dict:
     if not SESSION_START_FILE.exists():
         return {}
     try:
-        with open(SESSION_START_FILE, encoding="utf-8") as f:
-            return json.load(f)
+        return _json_loads(SESSION_START_FILE.read_bytes())
     except Exception:
         return {}
 
 
-def _compute_bankroll_from_trades(starting: float, trades: List[dict], up_to_date: Optional[str] = None) -> float:
-    """Compute bankroll = starting + sum of pnl up to (and including) up_to_date."""
-    total = starting
+def _scan_trades_for_day(starting: float, trades: Iterable[Trade], date_str: str, prev_date: str) -> tuple:
+    """One pass over all trades: (bankroll after prev_date, bankroll after date_str, trades closed
+    on date_str). Bankroll = starting + pnl of trades that exited on or before the date; trades
+    with no exit date count toward both."""
+    at_prev = at_today = starting
+    closed_day = []
     for t in trades:
-        et = (t.get("exit_time") or "")[:10]
-        if up_to_date and et and et > up_to_date:
+        d = t.exit_date
+        if d and d > date_str:
             continue
-        pnl = t.get("pnl_usdc")
-        if pnl and str(pnl).strip():
-            try:
-                total += float(pnl)
-            except (ValueError, TypeError):
-                pass
-    return total
+        at_today += t.pnl
+        if not d or d <= prev_date:
+            at_prev += t.pnl
+        elif t.closed and d == date_str:
+            closed_day.append(t)
+    return at_prev, at_today, closed_day
+
+
+_NBA_RE = re.compile(r"nba|basketball|lebron|lakers|warriors", re.IGNORECASE)
 
 
 def _is_nba_market(question: str) -> bool:
-    """Detect NBA-related markets from question text."""
-    q = (question or "").lower()
-    return "nba" in q or "basketball" in q or "lebron" in q or "lakers" in q or "warriors" in q
+    """Detect NBA-related markets from question text (one case-insensitive scan, no lowercased copy)."""
+    return bool(question) and _NBA_RE.search(question) is not None
 
 
+@lru_cache(maxsize=256)
 def _get_strategy_display(s: str) -> str:
+    """Display name for a strategy tag; memoized since the same few tags repeat every report."""
     return STRATEGY_DISPLAY.get((s or "").strip().upper(), (s or "Other").replace("_", " "))
 
 
-def _compute_streaks(trades: List[dict]) -> tuple:
-    """Return (max_win_streak, max_loss_streak) from ordered trades."""
-    if not trades:
-        return 0, 0
-    ordered = sorted(trades, key=lambda t: t.get("exit_time", ""))
-    max_win, max_loss = 0, 0
-    cur_win, cur_loss = 0, 0
-    for t in ordered:
-        pnl = float(t.get("pnl_usdc", 0) or 0)
-        if pnl > 0:
-            cur_win += 1
-            cur_loss = 0
-            max_win = max(max_win, cur_win)
-        else:
-            cur_loss += 1
-            cur_win = 0
-            max_loss = max(max_loss, cur_loss)
-    return max_win, max_loss
+MARKET_CONDITION_KEYS = ("btc_usd", "eth_usd", "btc_24h_change", "eth_24h_change", "btc_funding", "eth_funding")
+MARKET_CACHE_TTL_SECONDS = 60
+MARKET_CACHE_NAME = ".market_cache.json"  # In REPORTS_DIR; lets re-generated reports skip the fetch
+_market_cache: Optional[tuple] = None     # (time.time() of fetch, result)
+
+
+def _cached_market_conditions() -> Optional[dict]:
+    """The memoized market conditions if younger than MARKET_CACHE_TTL_SECONDS, else None."""
+    global _market_cache
+    if _market_cache is None:
+        try:
+            cached = _json_loads((REPORTS_DIR / MARKET_CACHE_NAME).read_bytes())
+            _market_cache = (float(cached["fetched_at"]), cached["result"])
+        except Exception:
+            pass
+    if _market_cache is not None and time.time() - _market_cache[0] < MARKET_CACHE_TTL_SECONDS:
+        return dict(_market_cache[1])
+    return None
+
+
+def _store_market_conditions(result: dict) -> None:
+    global _market_cache
+    if not any(v is not None for v in result.values()):  # Don't pin a total outage for the TTL
+        return
+    now = time.time()
+    _market_cache = (now, result)
+    try:
+        REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        (REPORTS_DIR / MARKET_CACHE_NAME).write_bytes(_json_dumps({"fetched_at": now, "result": result}))
+    except Exception as e:
+        logger.debug(f"Could not write market cache: {e}")
 
 
 def _fetch_market_conditions() -> dict:
-    """Fetch BTC/ETH prices and funding rates (async-friendly via aiohttp if available)."""
-    result = {
-        "btc_usd": None,
-        "eth_usd": None,
-        "btc_24h_change": None,
-        "eth_24h_change": None,
-        "btc_funding": None,
-        "eth_funding": None,
-    }
+    """Market conditions, reused for MARKET_CACHE_TTL_SECONDS (in memory, mirrored to disk so
+    a restart or a manual re-generation doesn't re-fetch)."""
+    cached = _cached_market_conditions()
+    if cached is not None:
+        return cached
+    result = _fetch_market_conditions_live()
+    _store_market_conditions(result)
+    return dict(result)
+
+
+async def _fetch_market_conditions_cached_async() -> dict:
+    """_fetch_market_conditions for callers already on an event loop (uses the shared session)."""
+    cached = _cached_market_conditions()
+    if cached is not None:
+        return cached
+    result = await _fetch_market_conditions_async()
+    _store_market_conditions(result)
+    return dict(result)
+
+
+# One aiohttp session per event loop, reused across report runs (keeps DNS/TLS/keep-alive warm).
+# A session is bound to the loop that created it, so a different loop gets a fresh one.
+_session: Optional["aiohttp.ClientSession"] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _retire_session(session: "aiohttp.ClientSession", loop: asyncio.AbstractEventLoop) -> None:
+    """Close a session that belongs to another event loop (its connector can only close there)."""
+    if session.closed:
+        return
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)  # Loop lives on another thread
+    else:
+        # Its loop has finished, so nothing can await the close any more. Every loop that opens
+        # the session closes it on exit (close_session), so this means an owner skipped that.
+        logger.warning("Report session left open by a finished event loop — dropping it")
+
+
+def _get_session() -> "aiohttp.ClientSession":
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None and _session_loop is not loop:
+            _retire_session(_session, _session_loop)
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, limit_per_host=8, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=5),
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared report session (bot and dashboard shutdown, throwaway sync-caller loops)."""
+    global _session, _session_loop
+    session, session_loop = _session, _session_loop
+    _session = None
+    _session_loop = None
+    if session is None or session.closed:
+        return
+    if session_loop is asyncio.get_running_loop():
+        await session.close()
+    else:
+        _retire_session(session, session_loop)
+
+
+def _fetch_market_conditions_live() -> dict:
+    """Blocking fetch for sync callers: runs on a throwaway loop, so its session is closed after."""
+    async def _once():
+        try:
+            return await _fetch_market_conditions_async()
+        finally:
+            await close_session()
+
     try:
-        import aiohttp
-        import asyncio
-
-        async def _fetch():
-            async with aiohttp.ClientSession() as session:
-                url = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,ethereum&vs_currencies=usd&include_24hr_change=true"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        btc = data.get("bitcoin", {})
-                        eth = data.get("ethereum", {})
-                        result["btc_usd"] = btc.get("usd")
-                        result["eth_usd"] = eth.get("usd")
-                        result["btc_24h_change"] = btc.get("usd_24h_change")
-                        result["eth_24h_change"] = eth.get("usd_24h_change")
-                for sym, key in [("BTCUSDT", "btc_funding"), ("ETHUSDT", "eth_funding")]:
-                    try:
-                        furl = f"https://fapi.binance.com/fapi/v1/premiumIndex?symbol={sym}"
-                        async with session.get(furl, timeout=aiohttp.ClientTimeout(total=3)) as fr:
-                            if fr.status == 200:
-                                fd = await fr.json()
-                                result[key] = round(float(fd.get("lastFundingRate", 0)) * 100, 4)
-                    except Exception:
-                        pass
-
-        asyncio.run(_fetch())
+        return asyncio.run(_once())
     except Exception as e:
         logger.debug(f"Market conditions fetch failed: {e}")
-    return result
+        return dict.fromkeys(MARKET_CONDITION_KEYS)
 
 
-def generate_daily_report(date_str: Optional[str] = None) -> dict:
+def generate_daily_report(date_str: Optional[str] = None, market_cond: Optional[dict] = None) -> dict:
     """
     Generate a full daily report for the given date (YYYY-MM-DD).
-    If date_str is None, uses today UTC.
+    If date_str is None, uses today UTC. market_cond (from _fetch_market_conditions) is fetched
+    here when not passed in.
     """
     if date_str is None:
         date_str = datetime.now(timezone.utc).date().isoformat()
 
-    trades = _read_trades()
     state = _read_state()
     session = _read_session_start()
 
-    # Trades that closed on this day
-    day_trades = [
-        t for t in trades
-        if (t.get("exit_time") or "").startswith(date_str)
-        and t.get("pnl_usdc") and str(t.get("pnl_usdc", "")).strip()
-    ]
-    closed_day = [t for t in day_trades if t.get("pnl_usdc")]
-    pnls = [float(t.get("pnl_usdc", 0) or 0) for t in closed_day]
-
-    # Bankroll
+    # Bankroll at start of day = cumulative after previous day; ending = cumulative after today.
+    # The same streaming pass over trades.csv collects the trades that closed on this day.
     starting_bankroll = float(session.get("starting_bankroll", state.get("bankroll", 1000)))
-    ending_bankroll = _compute_bankroll_from_trades(starting_bankroll, trades, up_to_date=date_str)
-
-    # Bankroll at start of day = cumulative after previous day
     prev_date = (datetime.strptime(date_str, "%Y-%m-%d") - timedelta(days=1)).date().isoformat()
-    bankroll_start_of_day = _compute_bankroll_from_trades(starting_bankroll, trades, up_to_date=prev_date)
+    bankroll_start_of_day, ending_bankroll, closed_day = _scan_trades_for_day(
+        starting_bankroll, _iter_trades(), date_str, prev_date
+    )
+    closed_day.sort(key=lambda t: t.exit_time)
+
+    # One pass over the day's trades (in exit order, for the streaks): totals, best/worst,
+    # streaks, per-strategy P&L and the NBA/crypto split
+    net_pnl = 0.0
+    wins_count = 0
+    total_wins = 0.0
+    total_losses = 0.0
+    best_t, best_pnl = None, 0.0
+    worst_t, worst_pnl = None, float("inf")
+    max_win_streak = max_loss_streak = cur_win = cur_loss = 0
+    strat_agg: Dict[str, list] = {}  # strategy -> [pnl, trades], updated in place
+    nba_count = 0
+    crypto_count = 0
+    nba_pnl = 0.0
+    nba_wins = 0
+    best_nba = worst_nba = None
+    for t in closed_day:
+        pnl = t.pnl
+        net_pnl += pnl
+        if pnl > 0:
+            wins_count += 1
+            total_wins += pnl
+            if pnl > best_pnl:
+                best_t, best_pnl = t, pnl
+            cur_win += 1
+            cur_loss = 0
+            if cur_win > max_win_streak:
+                max_win_streak = cur_win
+        else:
+            total_losses -= pnl
+            if pnl < worst_pnl:
+                worst_t, worst_pnl = t, pnl
+            cur_loss += 1
+            cur_win = 0
+            if cur_loss > max_loss_streak:
+                max_loss_streak = cur_loss
+        agg = strat_agg.get(t.strategy)
+        if agg is None:
+            strat_agg[t.strategy] = [pnl, 1]
+        else:
+            agg[0] += pnl
+            agg[1] += 1
+        if t.is_nba:
+            nba_count += 1
+            nba_pnl += pnl
+            if best_nba is None or pnl > best_nba.pnl:
+                best_nba = t
+            if worst_nba is None or pnl < worst_nba.pnl:
+                worst_nba = t
+            if pnl > 0:
+                nba_wins += 1
+        else:
+            crypto_count += 1
 
-    net_pnl = sum(pnls)
     net_pnl_pct = (net_pnl / bankroll_start_of_day * 100) if bankroll_start_of_day else 0
 
     # Goal
-    try:
-        from config import BotConfig
-        daily_goal = BotConfig().DAILY_PROFIT_GOAL_USD
-    except Exception:
-        daily_goal = 1000.0
+    cfg = _bot_config()
+    daily_goal = cfg.DAILY_PROFIT_GOAL_USD if cfg else 1000.0
     goal_progress_pct = min(100, max(0, (net_pnl / daily_goal) * 100)) if daily_goal else 0
 
     # Best/worst trade
-    best_trade = None
-    worst_trade = None
-    if closed_day:
-        wins = [t for t in closed_day if float(t.get("pnl_usdc", 0) or 0) > 0]
-        losses = [t for t in closed_day if float(t.get("pnl_usdc", 0) or 0) <= 0]
-        if wins:
-            best = max(wins, key=lambda t: float(t.get("pnl_usdc", 0)))
-            best_trade = {
-                "market": (best.get("question") or "")[:60],
-                "size_usdc": float(best.get("size_usdc", 0) or 0),
-                "profit": float(best.get("pnl_usdc", 0) or 0),
-            }
-        if losses:
-            worst = min(losses, key=lambda t: float(t.get("pnl_usdc", 0)))
-            worst_trade = {
-                "market": (worst.get("question") or "")[:60],
-                "size_usdc": float(worst.get("size_usdc", 0) or 0),
-                "loss": float(worst.get("pnl_usdc", 0) or 0),
-            }
-
-    # Win rate, profit factor, streaks
-    wins_count = len([t for t in closed_day if float(t.get("pnl_usdc", 0) or 0) > 0])
+    best_trade = {
+        "market": best_t.question[:60],
+        "size_usdc": best_t.size,
+        "profit": best_pnl,
+    } if best_t else None
+    worst_trade = {
+        "market": worst_t.question[:60],
+        "size_usdc": worst_t.size,
+        "loss": worst_pnl,
+    } if worst_t else None
+
+    # Win rate, profit factor
     win_rate = (wins_count / len(closed_day) * 100) if closed_day else 0
-    total_wins = sum(float(t.get("pnl_usdc", 0)) for t in closed_day if float(t.get("pnl_usdc", 0) or 0) > 0)
-    total_losses = abs(sum(float(t.get("pnl_usdc", 0)) for t in closed_day if float(t.get("pnl_usdc", 0) or 0) <= 0))
     profit_factor = total_wins / total_losses if total_losses > 0 else (float("inf") if total_wins > 0 else 0)
-    max_win_streak, max_loss_streak = _compute_streaks(closed_day)
 
     # Crypto by strategy
-    crypto_strategies = ["BTC_MOMENTUM", "ETH_LAG", "SOL_SQUEEZE", "MAKER", "XRP_CATALYST"]
-    strategy_pnl = defaultdict(float)
-    strategy_trades = defaultdict(int)
-    nba_trades = []
-    crypto_trades = []
-    for t in closed_day:
-        strat = (t.get("strategy") or "").strip() or "OTHER"
-        pnl = float(t.get("pnl_usdc", 0) or 0)
-        strategy_pnl[strat] += pnl
-        strategy_trades[strat] += 1
-        if _is_nba_market(t.get("question") or ""):
-            nba_trades.append(t)
-        else:
-            crypto_trades.append(t)
-
+    # Highest P&L wins ties by first appearance; lowest by last (same picks as a stable sort)
     best_strategy = None
     worst_strategy = None
-    if strategy_pnl:
-        sorted_strats = sorted(strategy_pnl.items(), key=lambda x: -x[1])
-        if sorted_strats:
-            best_strategy = sorted_strats[0][0]
-            worst_strategy = sorted_strats[-1][0]
-
-    nba_pnl = sum(float(t.get("pnl_usdc", 0) or 0) for t in nba_trades)
-    nba_wins = len([t for t in nba_trades if float(t.get("pnl_usdc", 0) or 0) > 0])
-    nba_win_rate = (nba_wins / len(nba_trades) * 100) if nba_trades else None
-    best_nba = max(nba_trades, key=lambda t: float(t.get("pnl_usdc", 0) or 0)) if nba_trades else None
-    worst_nba = min(nba_trades, key=lambda t: float(t.get("pnl_usdc", 0) or 0)) if nba_trades else None
+    best_strat_pnl = worst_strat_pnl = 0.0
+    for strat, (spnl, _) in strat_agg.items():
+        if best_strategy is None or spnl > best_strat_pnl:
+            best_strategy, best_strat_pnl = strat, spnl
+        if worst_strategy is None or spnl <= worst_strat_pnl:
+            worst_strategy, worst_strat_pnl = strat, spnl
+
+    nba_win_rate = (nba_wins / nba_count * 100) if nba_count else None
 
     # Risk summary
     risk_state = (state.get("bot_activity") or {}).get("risk_state") or {}
@@ -300,7 +522,8 @@ def generate_daily_report(date_str: Optional[str] = None) -> dict:
     rejected_reasons = []
 
     # Market conditions
-    market_cond = _fetch_market_conditions()
+    if market_cond is None:
+        market_cond = _fetch_market_conditions()
     markets_scanned = (state.get("bot_activity") or {}).get("markets_last_scan", 0)
     markets_with_edge = (state.get("bot_activity") or {}).get("markets_with_edge", 0)
 
@@ -328,24 +551,24 @@ def generate_daily_report(date_str: Optional[str] = None) -> dict:
         },
         "crypto_performance": {
             "by_strategy": {
-                _get_strategy_display(s): {"pnl": round(v, 2), "trades": strategy_trades.get(s, 0)}
-                for s, v in strategy_pnl.items()
+                _get_strategy_display(s): {"pnl": round(p, 2), "trades": c}
+                for s, (p, c) in strat_agg.items()
             },
             "best_strategy": _get_strategy_display(best_strategy) if best_strategy else None,
             "worst_strategy": _get_strategy_display(worst_strategy) if worst_strategy else None,
-            "crypto_trades": len(crypto_trades),
-            "nba_trades": len(nba_trades),
+            "crypto_trades": crypto_count,
+            "nba_trades": nba_count,
         },
         "nba_performance": {
             "nba_pnl": round(nba_pnl, 2),
             "nba_win_rate": round(nba_win_rate, 1) if nba_win_rate is not None else None,
             "best_nba": {
-                "market": (best_nba.get("question") or "")[:60],
-                "pnl": round(float(best_nba.get("pnl_usdc", 0) or 0), 2),
+                "market": best_nba.question[:60],
+                "pnl": round(best_nba.pnl, 2),
             } if best_nba else None,
             "worst_nba": {
-                "market": (worst_nba.get("question") or "")[:60],
-                "pnl": round(float(worst_nba.get("pnl_usdc", 0) or 0), 2),
+                "market": worst_nba.question[:60],
+                "pnl": round(worst_nba.pnl, 2),
             } if worst_nba else None,
             "injury_signals": "No injury signal tracking",
         },
@@ -372,15 +595,14 @@ def generate_daily_report(date_str: Optional[str] = None) -> dict:
     return report
 
 
-def _build_equity_curve(trades: List[dict], start_bankroll: float) -> List[dict]:
+def _build_equity_curve(trades: List[Trade], start_bankroll: float) -> List[dict]:
     """Build data points for ASCII equity curve: [{"time": "...", "bankroll": n}, ...]."""
-    ordered = sorted(trades, key=lambda t: t.get("exit_time", ""))
-    curve = [{"time": "Start", "bankroll": round(start_bankroll, 2)}]
-    cum = start_bankroll
-    for t in ordered:
-        pnl = float(t.get("pnl_usdc", 0) or 0)
-        cum += pnl
-        et = t.get("exit_time", "")
+    ordered = sorted(trades, key=attrgetter("exit_time"))
+    # Running bankroll via accumulate (the summation loop runs in C); the first value is the start
+    running = accumulate([t.pnl for t in ordered], initial=start_bankroll)
+    curve = [{"time": "Start", "bankroll": round(next(running), 2)}]
+    for t, cum in zip(ordered, running):
+        et = t.exit_time
         curve.append({"time": et[11:19] if len(et) >= 19 else et, "bankroll": round(cum, 2)})
     return curve
 
@@ -396,15 +618,20 @@ def generate_weekly_report(week_end_date: Optional[str] = None) -> dict:
         week_end = now.date() - timedelta(days=days_since_sunday)
         week_end_date = week_end.isoformat()
 
+    week_start = (datetime.strptime(week_end_date, "%Y-%m-%d") - timedelta(days=6)).date().isoformat()
     reports_dir = REPORTS_DIR
     daily_reports = []
     if reports_dir.exists():
+        # Daily reports are saved as YYYY-MM-DD.json: pick the week's files by name (ISO dates
+        # sort lexicographically) and only parse those
         for f in reports_dir.glob("*.json"):
+            stem = f.stem
+            if len(stem) != 10 or stem.count("-") != 2 or not (week_start <= stem <= week_end_date):
+                continue
             try:
-                data = json.loads(f.read_text(encoding="utf-8"))
+                data = _json_loads(f.read_bytes())
                 if data.get("report_type") == "daily" and data.get("date"):
                     d = data["date"]
-                    week_start = (datetime.strptime(week_end_date, "%Y-%m-%d") - timedelta(days=6)).date().isoformat()
                     if week_start <= d <= week_end_date:
                         daily_reports.append(data)
             except Exception:
@@ -416,16 +643,12 @@ def generate_weekly_report(week_end_date: Optional[str] = None) -> dict:
     best_day = max(daily_reports, key=lambda r: r.get("performance_summary", {}).get("net_pnl_usd", 0)) if daily_reports else None
     worst_day = min(daily_reports, key=lambda r: r.get("performance_summary", {}).get("net_pnl_usd", 0)) if daily_reports else None
 
-    trades = _read_trades()
     session = _read_session_start()
     starting = float(session.get("starting_bankroll", 1000))
-    week_start = (datetime.strptime(week_end_date, "%Y-%m-%d") - timedelta(days=6)).date().isoformat()
     bankroll_series = [starting]
-    for d in sorted(set((t.get("exit_time") or "")[:10] for t in trades if (t.get("exit_time") or "")[:10])):
-        if not d or d < week_start or d > week_end_date:
-            continue
-        day_pnl = sum(float(t.get("pnl_usdc", 0) or 0) for t in trades if (t.get("exit_time") or "")[:10] == d)
-        bankroll_series.append(bankroll_series[-1] + day_pnl)
+    by_date = _trades_by_date()
+    for d in sorted(d for d in by_date if week_start <= d <= week_end_date):
+        bankroll_series.append(bankroll_series[-1] + sum(t.pnl for t in by_date[d]))
 
     # Week-over-week: load previous week's weekly report if exists
     prev_week_end = (datetime.strptime(week_end_date, "%Y-%m-%d") - timedelta(days=7)).date().isoformat()
@@ -433,7 +656,7 @@ def generate_weekly_report(week_end_date: Optional[str] = None) -> dict:
     prev_week_pnl = None
     if prev_report_path.exists():
         try:
-            prev_data = json.loads(prev_report_path.read_text(encoding="utf-8"))
+            prev_data = _json_loads(prev_report_path.read_bytes())
             prev_week_pnl = prev_data.get("total_pnl")
         except Exception:
             pass
@@ -603,8 +826,8 @@ def _report_to_discord_embed(report: dict) -> dict:
     }
 
 
-def send_email(report: dict, config: dict) -> bool:
-    """Send report via SMTP (Gmail)."""
+def send_email(report: dict, config: dict, html: Optional[str] = None) -> bool:
+    """Send report via SMTP (Gmail). html is the pre-rendered body, if the caller has one."""
     to_addr = config.get("report_email_to", "").strip()
     from_addr = config.get("report_email_from", "").strip()
     password = config.get("report_email_password", "").strip()
@@ -616,7 +839,8 @@ def send_email(report: dict, config: dict) -> bool:
         msg["Subject"] = f"PolyMarket Daily Report — {report.get('date', '')}"
         msg["From"] = from_addr
         msg["To"] = to_addr
-        html = _report_to_html(report)
+        if html is None:
+            html = _report_to_html(report)
         msg.attach(MIMEText(html, "html"))
         with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
             server.login(from_addr, password)
@@ -628,15 +852,16 @@ def send_email(report: dict, config: dict) -> bool:
         return False
 
 
-def send_discord(report: dict, config: dict) -> bool:
-    """Send report to Discord webhook."""
+def send_discord(report: dict, config: dict, payload: Optional[bytes] = None) -> bool:
+    """Send report to Discord webhook. payload is the pre-encoded embed JSON, if the caller has one."""
     url = config.get("discord_webhook_url", "").strip()
     if not url:
         logger.debug("Discord webhook not configured — skipping")
         return False
     try:
         import urllib.request
-        payload = json.dumps(_report_to_discord_embed(report)).encode("utf-8")
+        if payload is None:
+            payload = _json_dumps(_report_to_discord_embed(report))
         req = urllib.request.Request(url, data=payload, method="POST")
         req.add_header("Content-Type", "application/json")
         with urllib.request.urlopen(req, timeout=10) as resp:
@@ -648,6 +873,30 @@ def send_discord(report: dict, config: dict) -> bool:
     return False
 
 
+async def _send_discord_async(report: dict, config: dict, payload: Optional[bytes] = None) -> bool:
+    """send_discord on the shared aiohttp session instead of a blocking urllib call."""
+    url = config.get("discord_webhook_url", "").strip()
+    if not url:
+        logger.debug("Discord webhook not configured — skipping")
+        return False
+    if aiohttp is None:
+        return await asyncio.to_thread(send_discord, report, config, payload)
+    try:
+        if payload is None:
+            payload = _json_dumps(_report_to_discord_embed(report))
+        async with _get_session().post(
+            url, data=payload, headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as resp:
+            if 200 <= resp.status < 300:
+                logger.info("Daily report sent to Discord")
+                return True
+            logger.error(f"Discord send failed: HTTP {resp.status}")
+    except Exception as e:
+        logger.error(f"Discord send failed: {e}", exc_info=True)
+    return False
+
+
 def save_report(report: dict, filename: Optional[str] = None) -> Path:
     """Save report to reports/ directory. Prune old reports (keep 90 days)."""
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -655,38 +904,69 @@ def save_report(report: dict, filename: Optional[str] = None) -> Path:
     if filename is None:
         filename = f"{date_str}.json"
     path = REPORTS_DIR / filename
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, default=str)
+    path.write_bytes(_json_dumps(report, indent=True))
     logger.info(f"Report saved to {path}")
 
-    # Prune: delete reports older than 90 days
-    cutoff = (datetime.now(timezone.utc) - timedelta(days=90)).date()
-    for f in REPORTS_DIR.glob("*.json"):
-        try:
-            if f.stem.count("-") == 2:
-                parts = f.stem.split("-")
-                if len(parts) == 3:
-                    d = datetime(int(parts[0]), int(parts[1]), int(parts[2])).date()
-                    if d < cutoff:
-                        f.unlink()
-                        logger.debug(f"Pruned old report {f.name}")
-        except Exception:
-            pass
+    # Prune: delete daily reports (YYYY-MM-DD.json) older than 90 days. ISO dates compare
+    # correctly as strings, so the name is checked without building a datetime.
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=90)).date().isoformat()
+    with os.scandir(REPORTS_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            if len(name) != 15 or not name.endswith(".json") or name.count("-") != 2 or name[:10] >= cutoff:
+                continue
+            try:
+                if entry.is_file():
+                    os.unlink(entry.path)
+                    logger.debug(f"Pruned old report {name}")
+            except OSError:
+                pass
     return path
 
 
+def _build_daily_delivery(market_cond: Optional[dict], want_email: bool, want_discord: bool) -> tuple:
+    """Generate today's report plus its email body and Discord payload, each rendered once."""
+    report = generate_daily_report(None, market_cond)
+    html = _report_to_html(report) if want_email else None
+    payload = _json_dumps(_report_to_discord_embed(report)) if want_discord else None
+    return report, html, payload
+
+
 def run_daily_report(send_email_flag: bool = True, send_discord_flag: bool = True) -> dict:
     """
     Generate daily report, save to JSON, optionally send via email and Discord.
     Returns the report dict.
     """
     config = _load_config()
-    report = generate_daily_report()
+    want_email = bool(send_email_flag and config.get("report_email_to"))
+    want_discord = bool(send_discord_flag and config.get("discord_webhook_url"))
+    report, html, payload = _build_daily_delivery(None, want_email, want_discord)
     save_report(report)
-    if send_email_flag and config.get("report_email_to"):
-        send_email(report, config)
-    if send_discord_flag and config.get("discord_webhook_url"):
-        send_discord(report, config)
+    if want_email:
+        send_email(report, config, html)
+    if want_discord:
+        send_discord(report, config, payload)
+    return report
+
+
+async def run_daily_report_async(send_email_flag: bool = True, send_discord_flag: bool = True) -> dict:
+    """
+    run_daily_report for callers on an event loop (scheduler, API). Report building runs in a
+    worker thread; saving, email and Discord then run concurrently.
+    """
+    config = _load_config()
+    want_email = bool(send_email_flag and config.get("report_email_to"))
+    want_discord = bool(send_discord_flag and config.get("discord_webhook_url"))
+    market_cond = await _fetch_market_conditions_cached_async()
+    report, html, payload = await asyncio.to_thread(
+        _build_daily_delivery, market_cond, want_email, want_discord
+    )
+    jobs = [asyncio.to_thread(save_report, report)]
+    if want_email:
+        jobs.append(asyncio.to_thread(send_email, report, config, html))  # smtplib in a thread
+    if want_discord:
+        jobs.append(_send_discord_async(report, config, payload))
+    await asyncio.gather(*jobs)
     return report
 
 
@@ -53,6 +53,8 @@ if [ -f "$PROJECT_DIR/.env" ]; then
   scp "$PROJECT_DIR/.env" "${SSH_TARGET}:/home/${SSH_USER}/polymarket/.env"
   echo ">>> Setting PRICE_FEED_SOURCE=binance (Frankfurt can access Binance API)..."
   ssh "$SSH_TARGET" "sed -i 's/^PRICE_FEED_SOURCE=.*/PRICE_FEED_SOURCE=binance/' /home/${SSH_USER}/polymarket/.env; grep -q '^PRICE_FEED_SOURCE=' /home/${SSH_USER}/polymarket/.env || echo 'PRICE_FEED_SOURCE=binance' >> /home/${SSH_USER}/polymarket/.env"
+  echo ">>> Re-freezing non-secret config from the uploaded .env..."
+  ssh "$SSH_TARGET" "cd /home/${SSH_USER}/polymarket && venv/bin/python freeze_config.py"
   echo ">>> Restarting bot to pick up .env..."
   ssh "$SSH_TARGET" "systemctl --user restart polymarket-bot"
 fi
@@ -62,6 +62,10 @@ else
   echo "PRICE_FEED_SOURCE=binance" >> .env
 fi
 
+# Snapshot non-secret settings into config_frozen.py (secrets are still read from .env)
+echo ">>> Freezing config..."
+python freeze_config.py
+
 # Install systemd user service (runs as DEPLOY_USER)
 SERVICE_FILE="/home/${DEPLOY_USER}/.config/systemd/user/polymarket-bot.service"
 mkdir -p "$(dirname "$SERVICE_FILE")"
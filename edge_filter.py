@@ -16,65 +16,173 @@ Philosophy: if the edge isn't clear, the answer is no trade.
 """
 
 import logging
-import statistics
+import math
+import re
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from config import BotConfig
+from config import BotConfig, CATALYST_STATE, CatalystState, SizingMode
 from models import Market, EdgeResult, Side, OrderBook
 
 logger = logging.getLogger("edge_filter")
 
+try:
+    from zoneinfo import ZoneInfo
+    _ET = ZoneInfo("America/New_York")
+except ImportError:
+    _ET = timezone.utc  # fallback if zoneinfo unavailable
+
+# One case-insensitive scan finds every asset keyword (substring match, as before);
+# when several assets appear, BTC > ETH > SOL > XRP priority decides
+_ASSET_KEYWORDS = {
+    "bitcoin": "BTC", "btc": "BTC",
+    "ethereum": "ETH", "eth": "ETH",
+    "solana": "SOL", "sol": "SOL",
+    "xrp": "XRP", "ripple": "XRP",
+}
+_ASSET_RE = re.compile("|".join(_ASSET_KEYWORDS), re.IGNORECASE)
+_ASSET_PRIORITY = ("BTC", "ETH", "SOL", "XRP")
+
+
+@lru_cache(maxsize=4096)
+def asset_from_question(question: str) -> str:
+    """BTC, ETH, SOL, XRP or UNKNOWN for a market question. Cached — the same questions recur every scan."""
+    found = {_ASSET_KEYWORDS[k.lower()] for k in _ASSET_RE.findall(question)}
+    if len(found) == 1:
+        return found.pop()
+    for asset in _ASSET_PRIORITY:
+        if asset in found:
+            return asset
+    return "UNKNOWN"
+
+
+@lru_cache(maxsize=16)
+def _level_weights(levels: int, decay: float) -> Tuple[float, ...]:
+    """exp(-i*decay) for i in 0..levels-1 — top of book counts most."""
+    return tuple(math.exp(-i * decay) for i in range(levels))
+
+
+def _weighted_depth(book_side: list, weights: Tuple[float, ...]) -> float:
+    return sum(w * l.price * l.size for w, l in zip(weights, book_side))
+
+
+class _StrategyProfile(NamedTuple):
+    """How a fired strategy-specific signal changes the decision for its asset."""
+    name: str                        # EdgeResult.strategy_name
+    credits: int                     # Extra signal credits on top of the base four
+    min_signals: Optional[int]       # Replaces the asset's minimum signal count (None = keep)
+    kelly_boost_field: Optional[str]  # BotConfig field replacing the base Kelly boost (None = keep)
+
+
+# Each asset has exactly one strategy signal, so its effect is a fixed row per asset.
+# Thresholds are named, not copied, so runtime edits to the config apply on the next evaluate.
+_STRATEGY_PROFILES = {
+    "BTC": _StrategyProfile("BTC_MOMENTUM", 1, None, None),
+    "ETH": _StrategyProfile("ETH_LAG", 2, 1, "ETH_LAG_SIGNAL_BOOST"),
+    "SOL": _StrategyProfile("SOL_SQUEEZE", 1, None, "SOL_SQUEEZE_SIGNAL_BOOST"),  # keeps SOL_MIN_EDGE_SIGNALS
+    "XRP": _StrategyProfile("XRP_CATALYST", 3, 1, "XRP_CATALYST_SIGNAL_BOOST"),
+}
+# Asset -> BotConfig field holding its minimum signal count (MIN_EDGE_SIGNALS otherwise)
+_MIN_SIGNALS_FIELD = {
+    "BTC": "MIN_EDGE_SIGNALS",
+    "ETH": "MIN_EDGE_SIGNALS",
+    "SOL": "SOL_MIN_EDGE_SIGNALS",
+    "XRP": "XRP_NO_CATALYST_MIN_SIGNALS",
+}
+
+
+# Bit i of the signal flags <-> _SIGNAL_NAMES[i] in EdgeResult.reason
+_SIGNAL_NAMES = (
+    "OB_IMBALANCE", "MOMENTUM", "VOLUME_SPIKE", "KELLY",
+    "BTC_MOMENTUM", "ETH_LAG", "SOL_SQUEEZE", "XRP_CATALYST",
+)
+
+
+@lru_cache(maxsize=1 << len(_SIGNAL_NAMES))
+def _fired_names(flags: int) -> str:
+    return ", ".join(name for i, name in enumerate(_SIGNAL_NAMES) if flags >> i & 1)
+
+
+_SIDE_BITS = {Side.YES: 1, Side.NO: 2}
+_MASK_SIDE = (None, Side.YES, Side.NO, None)  # indexed by the YES|NO bitmask
+
+_RSI_STATE_MAX = 512  # Markets with carried RSI state; 15-min windows roll over quickly
+_RSI_SEED_PERIODS = 4  # Seed Wilder RSI from at most this many periods of trailing ticks
+_SOL_LOOKBACK = 15     # Ticks the SOL squeeze reads: RSI period + 1 (also covers the 3-tick uptick)
+
 
 class EdgeFilter:
-    def __init__(self, config: BotConfig):
+    def __init__(self, config: BotConfig, catalyst_state: Optional[CatalystState] = None):
         self.config = config
+        self.catalyst = catalyst_state if catalyst_state is not None else CATALYST_STATE
+        # condition_id -> (last_tick_ts, last_price, avg_gain, avg_loss) for incremental RSI
+        self._rsi_state: Dict[str, Tuple[datetime, float, float, float]] = {}
 
     def _detect_asset(self, question) -> str:
         """Parse market question for asset: BTC, ETH, SOL, XRP, or UNKNOWN."""
         if hasattr(question, "question"):
             question = question.question
-        q = (str(question) if question is not None else "").lower()
-        if "bitcoin" in q or "btc" in q:
-            return "BTC"
-        if "ethereum" in q or "eth" in q:
-            return "ETH"
-        if "solana" in q or "sol" in q:
-            return "SOL"
-        if "xrp" in q or "ripple" in q:
-            return "XRP"
-        return "UNKNOWN"
-
-    def _is_within_active_hours(self) -> bool:
-        """True if current UTC time is within ACTIVE_HOURS (9 AM - 4 PM ET)."""
+        return asset_from_question(str(question) if question is not None else "")
+
+    def _is_within_active_hours(self, now_hour: Optional[int] = None) -> bool:
+        """
+        True if current UTC time is within ACTIVE_HOURS (9 AM - 4 PM ET).
+        Batch callers can pass `now_hour` (ET) once per scan instead of reading the clock per market.
+        """
         if not self.config.ACTIVE_HOURS_ENABLED:
             return True
-        try:
-            from zoneinfo import ZoneInfo
-            et = ZoneInfo("America/New_York")
-        except ImportError:
-            et = timezone.utc  # fallback if zoneinfo unavailable
-        now_et = datetime.now(et)
-        hour = now_et.hour
+        hour = now_hour if now_hour is not None else datetime.now(_ET).hour
         start, end = self.config.ACTIVE_HOURS_START, self.config.ACTIVE_HOURS_END
         if start <= end:
             return start <= hour < end
         return hour >= start or hour < end
 
-    @staticmethod
-    def _calculate_rsi(prices: List[float], period: int = 14) -> float:
-        """Wilder's RSI. Returns 0-100."""
-        if len(prices) < period + 1:
+    def _market_rsi(self, market: Market, period: int = 14) -> float:
+        """
+        Wilder-smoothed RSI for a market, carried across scans by condition_id.
+        Only ticks newer than the last one seen are folded in; the state is reseeded
+        from price_history when it no longer contains that tick. Returns 0-100.
+        """
+        history = market.price_history
+        if len(history) < period + 1:
             return 50.0
-        deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
-        gains = [d if d > 0 else 0 for d in deltas[-period:]]
-        losses = [-d if d < 0 else 0 for d in deltas[-period:]]
-        avg_gain = sum(gains) / period
-        avg_loss = sum(losses) / period
+        start = None
+        state = self._rsi_state.get(market.condition_id)
+        if state is not None:
+            last_ts, prev, avg_gain, avg_loss = state
+            i = len(history) - 1
+            while i >= 0 and history[i].timestamp > last_ts:
+                i -= 1
+            if i >= 0 and history[i].timestamp == last_ts:
+                start = i + 1
+        if start is None:
+            # Seed from a bounded tail (older ticks barely move a Wilder average):
+            # simple average of its first `period` deltas
+            start = max(0, len(history) - _RSI_SEED_PERIODS * period)
+            gain = loss = 0.0
+            prev = history[start].price
+            for tick in history[start + 1:start + period + 1]:
+                delta = tick.price - prev
+                if delta > 0:
+                    gain += delta
+                elif delta < 0:
+                    loss -= delta
+                prev = tick.price
+            avg_gain, avg_loss = gain / period, loss / period
+            start += period + 1
+            if len(self._rsi_state) >= _RSI_STATE_MAX:
+                self._rsi_state.pop(next(iter(self._rsi_state)))
+        for tick in history[start:]:
+            delta = tick.price - prev
+            avg_gain = (avg_gain * (period - 1) + (delta if delta > 0 else 0.0)) / period
+            avg_loss = (avg_loss * (period - 1) + (-delta if delta < 0 else 0.0)) / period
+            prev = tick.price
+        self._rsi_state[market.condition_id] = (history[-1].timestamp, prev, avg_gain, avg_loss)
         if avg_loss == 0:
             return 100.0
-        rs = avg_gain / avg_loss
-        return 100 - (100 / (1 + rs))
+        return 100 - (100 / (1 + avg_gain / avg_loss))
 
     async def evaluate(
         self,
@@ -87,50 +195,59 @@ class EdgeFilter:
         btc_is_neutral_or_up: bool = True,
         btc_price_history: Optional[list] = None,
         bankroll: Optional[float] = None,
+        now_utc: Optional[datetime] = None,
     ) -> EdgeResult:
         """
         Run all signal checks and return an EdgeResult.
         Only sets has_edge=True if minimum signals fire + Kelly confirms.
         Supports strategy-specific context via optional params.
+        `now_utc` lets a scan pass share one clock reading across all its markets.
         """
-        asset = self._detect_asset(market.question)
+        if now_utc is None:
+            now_utc = datetime.now(timezone.utc)
+        # StrategyRouter (or a previous evaluate) already tagged the market — skip re-parsing
+        asset = market.asset or self._detect_asset(market.question)
+        market.asset = asset
+
+        # Active hours gate: skip directional strategies 1, 2, 3 outside 9AM-4PM ET.
+        # Checked first — it needs only the asset, so rejected markets skip all book work.
+        # XRP catalyst and maker can run 24/7 per doc.
+        if (
+            asset in ("BTC", "ETH", "SOL")
+            and self.config.ACTIVE_HOURS_ENABLED
+            and not self._is_within_active_hours(now_utc.astimezone(_ET).hour)
+        ):
+            logger.info("[%s] GATE BLOCK: Outside active hours (9AM-4PM ET) — SKIP", asset)
+            return EdgeResult(
+                has_edge=False, side=None, signal_count=0,
+                reason="Outside active hours (9AM-4PM ET) — directional strategies disabled",
+            )
 
         # GATE: Order book required; price_history optional (CLOB often returns empty for 15-min markets)
         if not market.order_book:
-            logger.info(f"[{asset}] GATE BLOCK: No order book — SKIP")
+            logger.info("[%s] GATE BLOCK: No order book — SKIP", asset)
             return EdgeResult(has_edge=False, side=None, signal_count=0,
                               reason="Missing order book")
         if not market.price_history:
             market.price_history = []  # Allow eval with OB+Kelly only; momentum/vol will fail
-            logger.info(f"[{asset}] ORDERBOOK: price_history empty — using OB+Kelly only (no momentum/vol)")
+            logger.info("[%s] ORDERBOOK: price_history empty — using OB+Kelly only (no momentum/vol)", asset)
 
         mid = market.order_book.mid_price
         if mid is None:
-            logger.info(f"[{asset}] GATE BLOCK: No mid price — SKIP")
+            logger.info("[%s] GATE BLOCK: No mid price — SKIP", asset)
             return EdgeResult(has_edge=False, side=None, signal_count=0,
                               reason="No mid price available")
 
         # Log orderbook summary for every market
-        bid_depth = sum(l.price * l.size for l in market.order_book.yes_bids[:5])
-        ask_depth = sum(l.price * l.size for l in market.order_book.yes_asks[:5])
-        total_ob = bid_depth + ask_depth
+        total_ob = market.order_book.bid_depth(5) + market.order_book.ask_depth(5)
         n_bids = len(market.order_book.yes_bids)
         n_asks = len(market.order_book.yes_asks)
         if n_bids < 3 or n_asks < 3:
-            logger.info(f"[{asset}] ORDERBOOK: Thin book | bids={n_bids} asks={n_asks} depth=${total_ob:.0f} — may block signals")
+            logger.info("[%s] ORDERBOOK: Thin book | bids=%d asks=%d depth=$%.0f — may block signals",
+                        asset, n_bids, n_asks, total_ob)
         else:
-            logger.info(f"[{asset}] ORDERBOOK: bids={n_bids} asks={n_asks} depth=${total_ob:.0f} mid={mid:.3f}")
-        market.asset = asset
-
-        # Active hours gate: skip directional strategies 1, 2, 3 outside 9AM-4PM ET
-        if self.config.ACTIVE_HOURS_ENABLED and not self._is_within_active_hours():
-            if asset in ("BTC", "ETH", "SOL"):
-                logger.info(f"[{asset}] GATE BLOCK: Outside active hours (9AM-4PM ET) — SKIP")
-                return EdgeResult(
-                    has_edge=False, side=None, signal_count=0,
-                    reason="Outside active hours (9AM-4PM ET) — directional strategies disabled",
-                )
-            # XRP catalyst and maker can run 24/7 per doc
+            logger.info("[%s] ORDERBOOK: bids=%d asks=%d depth=$%.0f mid=%.3f",
+                        asset, n_bids, n_asks, total_ob, mid)
 
         # ── Strategy-specific signals ────────────────────────────────────────
         btc_mom_signal, btc_mom_side = False, None
@@ -141,9 +258,7 @@ class EdgeFilter:
         if asset == "BTC" and spot_price is not None and window_open_price is not None and pct_move is not None:
             # Kill switch: pct_move > MAX_ENTRY
             if abs(pct_move) > self.config.BTC_MOMENTUM_MAX_ENTRY:
-                logger.info(
-                    f"BTC move already {pct_move:.2%} — too late, edge priced in"
-                )
+                logger.info("BTC move already %.2f%% — too late, edge priced in", pct_move * 100)
                 return EdgeResult(has_edge=False, side=None, signal_count=0,
                                   reason="BTC_MOMENTUM_MAX_ENTRY kill switch")
             btc_price_ticks = btc_price_history or []
@@ -153,19 +268,22 @@ class EdgeFilter:
 
         if asset == "ETH" and btc_signal_state:
             eth_lag_signal, eth_lag_side = self._check_eth_lag_trade(
-                btc_signal_state, mid
+                btc_signal_state, mid, now_utc=now_utc
             )
 
+        # SOL: one bounded price list per scan, shared by the squeeze check and the reported RSI
+        sol_prices = [t.price for t in market.price_history[-_SOL_LOOKBACK:]] if asset == "SOL" else None
+
         if asset == "SOL" and funding_rate is not None:
             sol_squeeze_signal, sol_squeeze_side = self._check_sol_squeeze(
-                market, funding_rate, btc_is_neutral_or_up
+                market, funding_rate, btc_is_neutral_or_up, prices=sol_prices, now_utc=now_utc
             )
 
         if asset == "XRP":
-            xrp_catalyst_signal, xrp_catalyst_side = self._check_xrp_catalyst()
+            xrp_catalyst_signal, xrp_catalyst_side = self._check_xrp_catalyst(now_epoch=now_utc.timestamp())
             # XRP: require catalyst only when XRP_REQUIRE_CATALYST=true
-            if getattr(self.config, "XRP_REQUIRE_CATALYST", True) and not self.config.XRP_CATALYST_ACTIVE and not xrp_catalyst_signal:
-                logger.info(f"[{asset}] GATE BLOCK: XRP no catalyst active — SKIP")
+            if self.config.XRP_REQUIRE_CATALYST and not self.catalyst.active and not xrp_catalyst_signal:
+                logger.info("[%s] GATE BLOCK: XRP no catalyst active — SKIP", asset)
                 return EdgeResult(
                     has_edge=False, side=None, signal_count=0,
                     reason="XRP — no catalyst active, no trade",
@@ -179,20 +297,18 @@ class EdgeFilter:
         vol_signal, vol_ratio = self._check_volume_spike(market, asset=asset)
 
         # Resolve directional side: base + strategy-specific
-        consensus_side = self._resolve_directional_side(
-            ob_side, mom_side,
-            extra_sides=[btc_mom_side, eth_lag_side, sol_squeeze_side, xrp_catalyst_side],
+        consensus_side, directions_agree = self._consensus(
+            ob_side, mom_side, btc_mom_side, eth_lag_side, sol_squeeze_side, xrp_catalyst_side,
         )
-        kelly_boost = getattr(self.config, "BASE_KELLY_BOOST", 0.08)
-        if eth_lag_signal:
-            kelly_boost = self.config.ETH_LAG_SIGNAL_BOOST
-        elif sol_squeeze_signal:
-            kelly_boost = self.config.SOL_SQUEEZE_SIGNAL_BOOST
-        elif xrp_catalyst_signal:
-            kelly_boost = self.config.XRP_CATALYST_SIGNAL_BOOST
+        fired = btc_mom_signal or eth_lag_signal or sol_squeeze_signal or xrp_catalyst_signal
+        profile = _STRATEGY_PROFILES.get(asset) if fired else None
+
+        kelly_boost = self.config.BASE_KELLY_BOOST
+        if profile is not None and profile.kelly_boost_field is not None:
+            kelly_boost = getattr(self.config, profile.kelly_boost_field)
         # Binance funding alignment: negative funding + YES = shorts paying, potential squeeze
         elif funding_rate is not None and funding_rate < -0.0005 and consensus_side == Side.YES:
-            kelly_boost = getattr(self.config, "BASE_KELLY_BOOST", 0.08) + 0.02
+            kelly_boost += 0.02
         est_prob, implied_prob, kelly_edge, kelly_size, kelly_signal = \
             self._check_kelly(
                 mid, consensus_side,
@@ -207,47 +323,22 @@ class EdgeFilter:
         # ── Per-asset signal count ─────────────────────────────────────────────
         base_signals = [ob_signal, mom_signal, vol_signal, kelly_signal]
         base_count = sum(base_signals)
-        strategy_credits = 0
-        if eth_lag_signal:
-            strategy_credits = 2  # counts as 2
-        elif xrp_catalyst_signal:
-            strategy_credits = 3  # counts as 3
-        elif btc_mom_signal or sol_squeeze_signal:
-            strategy_credits = 1
-        effective_count = base_count + strategy_credits
-
-        min_signals_map = {
-            "BTC": self.config.MIN_EDGE_SIGNALS,
-            "ETH": self.config.MIN_EDGE_SIGNALS,
-            "SOL": self.config.SOL_MIN_EDGE_SIGNALS,
-            "XRP": self.config.XRP_NO_CATALYST_MIN_SIGNALS,
-        }
-        min_signals = min_signals_map.get(asset, self.config.MIN_EDGE_SIGNALS)
-        if eth_lag_signal:
-            min_signals = 1  # ETH only needs 1 more when lag fires
-        if xrp_catalyst_signal:
-            min_signals = 1  # XRP only needs 1 when catalyst fires
-        if sol_squeeze_signal:
-            min_signals = self.config.SOL_MIN_EDGE_SIGNALS  # 2
-
-        directions_agree = self._directions_agree(
-            ob_side, mom_side,
-            extra_sides=[btc_mom_side, eth_lag_side, sol_squeeze_side, xrp_catalyst_side],
-        )
+        effective_count = base_count + (profile.credits if profile is not None else 0)
 
-        min_edge = max(
-            self.config.MIN_KELLY_EDGE,
-            getattr(self.config, "MIN_EDGE_PCT", 0.03),
-        )
+        min_signals = getattr(self.config, _MIN_SIGNALS_FIELD.get(asset, "MIN_EDGE_SIGNALS"))
+        if profile is not None and profile.min_signals is not None:
+            min_signals = profile.min_signals
+
+        min_edge = self.config.MIN_TRADE_EDGE
 
         # SIGNAL SUMMARY — logged for every market every scan (INFO = always in bot.log)
-        ob_str = "PASS" if ob_signal else "FAIL"
-        mom_str = "PASS" if mom_signal else "FAIL"
-        vol_str = f"PASS ({vol_ratio:.2f}x)" if vol_signal else f"FAIL ({vol_ratio:.2f}x < {self.config.VOLUME_SPIKE_MULTIPLIER})"
-        kelly_str = f"PASS ({kelly_edge:.2%})" if kelly_signal else f"FAIL ({kelly_edge:.2%} < {min_edge:.2%})"
         logger.info(
-            f"[{asset}] SIGNALS | OB:{ob_str} MOM:{mom_str} VOL:{vol_str} KELLY:{kelly_str} | "
-            f"side={consensus_side} dir_ok={directions_agree} size=${kelly_size:.2f} need={min_signals}"
+            "[%s] SIGNALS | OB:%s MOM:%s VOL:%s (%.2fx, min %s) KELLY:%s (%.2f%%, min %.2f%%) | "
+            "side=%s dir_ok=%s size=$%.2f need=%d",
+            asset, "PASS" if ob_signal else "FAIL", "PASS" if mom_signal else "FAIL",
+            "PASS" if vol_signal else "FAIL", vol_ratio, self.config.VOLUME_SPIKE_MULTIPLIER,
+            "PASS" if kelly_signal else "FAIL", kelly_edge * 100, min_edge * 100,
+            consensus_side, directions_agree, kelly_size, min_signals,
         )
 
         has_edge = (
@@ -260,8 +351,9 @@ class EdgeFilter:
 
         # Final decision log
         if has_edge:
-            logger.info(f"[{asset}] EDGE DECISION: TRADE | signals={effective_count}/{min_signals} edge={kelly_edge:.2%}")
-        else:
+            logger.info("[%s] EDGE DECISION: TRADE | signals=%d/%d edge=%.2f%%",
+                        asset, effective_count, min_signals, kelly_edge * 100)
+        elif logger.isEnabledFor(logging.INFO):  # fail_reasons is only built for the log line
             fail_reasons = []
             if effective_count < min_signals:
                 fail_reasons.append(f"signals {effective_count}<{min_signals}")
@@ -273,22 +365,13 @@ class EdgeFilter:
                 fail_reasons.append("no_side")
             if kelly_size < self.config.MIN_BET_SIZE:
                 fail_reasons.append(f"size ${kelly_size:.2f}<${self.config.MIN_BET_SIZE}")
-            logger.info(f"[{asset}] EDGE DECISION: NO TRADE | {', '.join(fail_reasons)}")
-
-        strategy_name = ""
-        if btc_mom_signal:
-            strategy_name = "BTC_MOMENTUM"
-        elif eth_lag_signal:
-            strategy_name = "ETH_LAG"
-        elif sol_squeeze_signal:
-            strategy_name = "SOL_SQUEEZE"
-        elif xrp_catalyst_signal:
-            strategy_name = "XRP_CATALYST"
+            logger.info("[%s] EDGE DECISION: NO TRADE | %s", asset, ", ".join(fail_reasons))
+
+        strategy_name = profile.name if profile is not None else ""
 
         rsi_val = 0.0
-        if asset == "SOL" and market.price_history:
-            prices = [t.price for t in market.price_history]
-            rsi_val = self._calculate_rsi(prices)
+        if sol_prices:
+            rsi_val = self._market_rsi(market)
 
         result = EdgeResult(
             has_edge=has_edge,
@@ -312,12 +395,13 @@ class EdgeFilter:
             kelly_edge=kelly_edge,
             kelly_size=kelly_size,
             entry_price=mid,
+            # Only trades (or DEBUG runs) read the signal breakdown; the NO TRADE log already lists why
             reason=self._build_reason(
-                ob_signal, mom_signal, vol_signal, kelly_signal,
+                ob_signal | mom_signal << 1 | vol_signal << 2 | kelly_signal << 3
+                | btc_mom_signal << 4 | eth_lag_signal << 5 | sol_squeeze_signal << 6
+                | xrp_catalyst_signal << 7,
                 directions_agree, kelly_edge,
-                btc_mom=btc_mom_signal, eth_lag=eth_lag_signal,
-                sol_squeeze=sol_squeeze_signal, xrp_catalyst=xrp_catalyst_signal,
-            ),
+            ) if has_edge or logger.isEnabledFor(logging.DEBUG) else "No edge",
         )
         return result
 
@@ -342,26 +426,27 @@ class EdgeFilter:
         # Directional consistency: 70% of last 5 ticks must align
         if price_ticks and len(price_ticks) >= 5:
             ticks = price_ticks[-5:]
-            deltas = [ticks[i + 1] - ticks[i] for i in range(len(ticks) - 1)]
+            # Sum comparison results directly (True == 1) — no delta list, no per-element branch
             if direction == Side.YES:
-                aligned = sum(1 for d in deltas if d > 0)
+                aligned = sum(b > a for a, b in zip(ticks, ticks[1:]))
             else:
-                aligned = sum(1 for d in deltas if d < 0)
-            if aligned / len(deltas) < self.config.MOMENTUM_DIRECTION_CONSISTENCY:
+                aligned = sum(b < a for a, b in zip(ticks, ticks[1:]))
+            if aligned / (len(ticks) - 1) < self.config.MOMENTUM_DIRECTION_CONSISTENCY:
                 return False, None
         return True, direction
 
     def _check_eth_lag_trade(
-        self, btc_signal_state: Dict, eth_mid_price: float
+        self, btc_signal_state: Dict, eth_mid_price: float, now_utc: Optional[datetime] = None
     ) -> Tuple[bool, Optional[Side]]:
         """Strategy 2: ETH lag — BTC fired, ETH odds not yet repriced."""
         if not btc_signal_state.get("fired"):
             return False, None
-        from datetime import datetime, timezone
         ts = btc_signal_state.get("timestamp")
         if not ts:
             return False, None
-        elapsed = (datetime.now(timezone.utc) - ts).total_seconds()
+        if now_utc is None:
+            now_utc = datetime.now(timezone.utc)
+        elapsed = (now_utc - ts).total_seconds()
         if elapsed > self.config.ETH_LAG_EXPIRY_SECONDS:
             return False, None
         btc_side = btc_signal_state.get("side")
@@ -372,10 +457,8 @@ class EdgeFilter:
         if dist_from_50 > self.config.ETH_LAG_MAX_REPRICING:
             return False, None
         pct_move = btc_signal_state.get("pct_move", 0)
-        logger.info(
-            f"ETH LAG SIGNAL: BTC moved {pct_move:.2%} {btc_side} — "
-            f"ETH odds at {eth_mid_price:.3f}, lag window open"
-        )
+        logger.info("ETH LAG SIGNAL: BTC moved %.2f%% %s — ETH odds at %.3f, lag window open",
+                    pct_move * 100, btc_side, eth_mid_price)
         return True, btc_side
 
     def _check_sol_squeeze(
@@ -383,24 +466,26 @@ class EdgeFilter:
         market: Market,
         funding_rate: float,
         btc_is_neutral_or_up: bool,
+        prices: Optional[List[float]] = None,
+        now_utc: Optional[datetime] = None,
     ) -> Tuple[bool, Optional[Side]]:
-        """Strategy 3: SOL short-squeeze detection."""
+        """Strategy 3: SOL short-squeeze detection. `prices` reuses evaluate()'s price list."""
         if funding_rate > self.config.SOL_FUNDING_RATE_THRESHOLD:
             return False, None
         if not btc_is_neutral_or_up:
             return False, None
         # Only enter in first 3 min of window
-        from datetime import datetime, timezone
-        now_ts = datetime.now(timezone.utc).timestamp()
+        now_ts = (now_utc or datetime.now(timezone.utc)).timestamp()
         window_duration = 15 * 60  # seconds
         window_start = market.end_timestamp - window_duration
         minutes_into_window = (now_ts - window_start) / 60
         if minutes_into_window > self.config.SOL_SQUEEZE_MAX_ENTRY_MINUTES:
             return False, None
-        prices = [t.price for t in market.price_history] if market.price_history else []
-        if len(prices) < 15:
+        if prices is None:
+            prices = [t.price for t in market.price_history[-_SOL_LOOKBACK:]]
+        if len(prices) < _SOL_LOOKBACK:
             return False, None
-        rsi = self._calculate_rsi(prices)
+        rsi = self._market_rsi(market)
         if rsi >= self.config.SOL_RSI_OVERSOLD_THRESHOLD:
             return False, None
         # Last 3 ticks show uptick 0.2%+ from local low
@@ -414,102 +499,101 @@ class EdgeFilter:
         uptick_pct = (latest - local_low) / local_low
         if uptick_pct < 0.002:
             return False, None
-        logger.info(
-            f"SOL SQUEEZE: funding={funding_rate:.6f}, RSI={rsi:.1f}, uptick confirmed"
-        )
+        logger.info("SOL SQUEEZE: funding=%.6f, RSI=%.1f, uptick confirmed", funding_rate, rsi)
         return True, Side.YES
 
     def _check_xrp_catalyst(
-        self, _market_side: Optional[Side] = None
+        self, _market_side: Optional[Side] = None, now_epoch: Optional[float] = None
     ) -> Tuple[bool, Optional[Side]]:
         """Strategy 5: XRP catalyst — only trade when catalyst flag active."""
-        if not self.config.XRP_CATALYST_ACTIVE:
+        catalyst = self.catalyst
+        if not catalyst.active:
             return False, None
-        set_time = self.config.XRP_CATALYST_SET_TIME
-        if set_time:
-            from datetime import datetime, timezone
-            try:
-                set_dt = datetime.fromisoformat(set_time.replace("Z", "+00:00"))
-                expiry_mins = self.config.XRP_CATALYST_EXPIRY_MINUTES
-                if (datetime.now(timezone.utc) - set_dt).total_seconds() > expiry_mins * 60:
-                    self.config.XRP_CATALYST_ACTIVE = False
-                    logger.warning("XRP catalyst expired — flag cleared")
-                    return False, None
-            except Exception:
-                pass
-        direction = self.config.XRP_CATALYST_DIRECTION.upper()
+        set_epoch = catalyst.set_epoch
+        if now_epoch is None:
+            now_epoch = time.time()
+        if set_epoch is not None and now_epoch - set_epoch > self.config.XRP_CATALYST_EXPIRY_MINUTES * 60:
+            catalyst.active = False
+            logger.warning("XRP catalyst expired — flag cleared")
+            return False, None
+        direction = catalyst.direction.upper()
         side = Side.YES if direction == "UP" else Side.NO
         return True, side
 
     # ── Signal 1: Order Book Imbalance ────────────────────────────────────────
 
+    def _ob_depths(self, ob: OrderBook) -> Tuple[float, float]:
+        """(bid, ask) notional over the top OB_DEPTH_LEVELS, level-weighted when OB_LEVEL_DECAY > 0."""
+        levels = self.config.OB_DEPTH_LEVELS
+        decay = self.config.OB_LEVEL_DECAY
+        if decay <= 0:
+            return ob.bid_depth(levels), ob.ask_depth(levels)
+        weights = _level_weights(levels, decay)
+        return _weighted_depth(ob.yes_bids, weights), _weighted_depth(ob.yes_asks, weights)
+
     def _check_order_book_imbalance(
         self, ob: OrderBook, no_ob: Optional[OrderBook] = None, asset: str = ""
     ) -> Tuple[bool, Optional[Side], float, float]:
         """
-        Compare bid depth vs ask depth across top N levels.
+        Compare bid depth vs ask depth across top N levels (optionally decay-weighted by level).
         If bids dominate → YES (price likely to rise).
         If asks dominate → NO (price likely to fall, buy NO = bet against YES).
         When no_ob provided: NO bids heavy = bearish, NO asks heavy = bullish; require agreement.
         Returns (signal, side, bid_ratio, ask_ratio).
         """
-        bid_depth = sum(
-            l.price * l.size
-            for l in ob.yes_bids[:self.config.OB_DEPTH_LEVELS]
-        )
-        ask_depth = sum(
-            l.price * l.size
-            for l in ob.yes_asks[:self.config.OB_DEPTH_LEVELS]
-        )
+        bid_depth, ask_depth = self._ob_depths(ob)
         total = bid_depth + ask_depth
         if total == 0:
-            logger.info(f"[{asset}] OB: bid_ratio=N/A ask_ratio=N/A (total=0) — FAIL")
+            logger.info("[%s] OB: bid_ratio=N/A ask_ratio=N/A (total=0) — FAIL", asset)
             return False, None, 0.0, 0.0
 
         bid_ratio = bid_depth / total
         ask_ratio = ask_depth / total
         threshold = self.config.OB_IMBALANCE_THRESHOLD
+        # bid_ratio >= t  <=>  (bid - ask) / total >= 2t - 1, and likewise for asks with the sign flipped,
+        # so one signed imbalance in [-1, 1] against ±band replaces two ratio checks per book
+        band = 2 * threshold - 1 - 1e-9  # tolerance: an exactly-at-threshold book still counts
+        imbalance = (bid_depth - ask_depth) / total
 
         yes_side = None
-        if bid_ratio >= threshold:
+        if imbalance >= band:
             yes_side = Side.YES
-        elif ask_ratio >= threshold:
+        elif imbalance <= -band:
             yes_side = Side.NO
 
         if no_ob and yes_side is not None:
-            no_bid = sum(l.price * l.size for l in no_ob.yes_bids[:self.config.OB_DEPTH_LEVELS])
-            no_ask = sum(l.price * l.size for l in no_ob.yes_asks[:self.config.OB_DEPTH_LEVELS])
+            no_bid, no_ask = self._ob_depths(no_ob)
             no_total = no_bid + no_ask
             if no_total > 0:
-                no_bid_ratio = no_bid / no_total
-                no_ask_ratio = no_ask / no_total
+                no_imbalance = (no_bid - no_ask) / no_total
                 no_side = None
-                if no_bid_ratio >= threshold:
+                if no_imbalance >= band:
                     no_side = Side.NO
-                elif no_ask_ratio >= threshold:
+                elif no_imbalance <= -band:
                     no_side = Side.YES
                 if no_side is not None and no_side != yes_side:
-                    logger.info(f"[{asset}] OB: YES/NO sides disagree — FAIL")
+                    logger.info("[%s] OB: YES/NO sides disagree — FAIL", asset)
                     return False, None, bid_ratio, ask_ratio
 
         if yes_side == Side.YES:
-            logger.info(f"[{asset}] OB: bid_ratio={bid_ratio:.2%} (thresh {threshold}) — PASS -> YES")
+            logger.info("[%s] OB: bid_ratio=%.2f%% (thresh %s) — PASS -> YES", asset, bid_ratio * 100, threshold)
             return True, Side.YES, bid_ratio, ask_ratio
         elif yes_side == Side.NO:
-            logger.info(f"[{asset}] OB: ask_ratio={ask_ratio:.2%} (thresh {threshold}) — PASS -> NO")
+            logger.info("[%s] OB: ask_ratio=%.2f%% (thresh %s) — PASS -> NO", asset, ask_ratio * 100, threshold)
             return True, Side.NO, bid_ratio, ask_ratio
 
         # Fallback: when book is balanced but mid is extreme (like trades.csv YES@0.185)
         mid = ob.mid_price
         if mid is not None:
             if mid < 0.42:
-                logger.info(f"[{asset}] OB: mid={mid:.3f} (<0.42) — PASS mid-extreme -> YES")
+                logger.info("[%s] OB: mid=%.3f (<0.42) — PASS mid-extreme -> YES", asset, mid)
                 return True, Side.YES, bid_ratio, ask_ratio
             if mid > 0.58:
-                logger.info(f"[{asset}] OB: mid={mid:.3f} (>0.58) — PASS mid-extreme -> NO")
+                logger.info("[%s] OB: mid=%.3f (>0.58) — PASS mid-extreme -> NO", asset, mid)
                 return True, Side.NO, bid_ratio, ask_ratio
 
-        logger.info(f"[{asset}] OB: bid_ratio={bid_ratio:.2%} ask_ratio={ask_ratio:.2%} (thresh {threshold}) — FAIL")
+        logger.info("[%s] OB: bid_ratio=%.2f%% ask_ratio=%.2f%% (thresh %s) — FAIL",
+                    asset, bid_ratio * 100, ask_ratio * 100, threshold)
         return False, None, bid_ratio, ask_ratio
 
     # ── Signal 2: Momentum / Price Velocity ───────────────────────────────────
@@ -524,32 +608,40 @@ class EdgeFilter:
         min_consistency = self.config.MOMENTUM_DIRECTION_CONSISTENCY
 
         if len(history) < self.config.MOMENTUM_WINDOW + 1:
-            logger.info(f"[{asset}] MOM: need {self.config.MOMENTUM_WINDOW+1} ticks, have {len(history)} — FAIL")
+            logger.info("[%s] MOM: need %d ticks, have %d — FAIL", asset, self.config.MOMENTUM_WINDOW + 1, len(history))
             return False, None
 
         window = history[-self.config.MOMENTUM_WINDOW:]
-        prices = [t.price for t in window]
 
-        start_price = prices[0]
-        end_price = prices[-1]
+        start_price = window[0].price
+        end_price = window[-1].price
         total_move = (end_price - start_price) / start_price if start_price > 0 else 0
 
-        # Check directional consistency (% of ticks moving in same direction)
-        tick_deltas = [prices[i+1] - prices[i] for i in range(len(prices)-1)]
-        if not tick_deltas:
-            logger.info(f"[{asset}] MOM: move={total_move:.2%} (no deltas) — FAIL")
+        # Check directional consistency (% of ticks moving in same direction) — one pass, no lists
+        n_deltas = len(window) - 1
+        if n_deltas <= 0:
+            logger.info("[%s] MOM: move=%.2f%% (no deltas) — FAIL", asset, total_move * 100)
             return False, None
 
-        up_ticks = sum(1 for d in tick_deltas if d > 0)
-        down_ticks = sum(1 for d in tick_deltas if d < 0)
-        consistency = max(up_ticks, down_ticks) / len(tick_deltas)
+        up_ticks = down_ticks = 0
+        prev = start_price
+        for tick in window[1:]:
+            price = tick.price
+            if price > prev:
+                up_ticks += 1
+            elif price < prev:
+                down_ticks += 1
+            prev = price
+        consistency = max(up_ticks, down_ticks) / n_deltas
 
         if abs(total_move) >= min_move and consistency >= min_consistency:
             side = Side.YES if total_move > 0 else Side.NO
-            logger.info(f"[{asset}] MOM: move={total_move:.2%} (min {min_move:.2%}) cons={consistency:.2%} — PASS -> {side}")
+            logger.info("[%s] MOM: move=%.2f%% (min %.2f%%) cons=%.2f%% — PASS -> %s",
+                        asset, total_move * 100, min_move * 100, consistency * 100, side)
             return True, side
 
-        logger.info(f"[{asset}] MOM: move={total_move:.2%} (min {min_move:.2%}) cons={consistency:.2%} (min {min_consistency:.2%}) — FAIL")
+        logger.info("[%s] MOM: move=%.2f%% (min %.2f%%) cons=%.2f%% (min %.2f%%) — FAIL",
+                    asset, total_move * 100, min_move * 100, consistency * 100, min_consistency * 100)
         return False, None
 
     # ── Signal 3: Volume Spike ────────────────────────────────────────────────
@@ -565,27 +657,24 @@ class EdgeFilter:
         ratio = 0.0
 
         if len(history) < window + 1:
-            logger.info(f"[{asset}] VOL: need {window+1} ticks, have {len(history)} — FAIL (ratio=N/A)")
+            logger.info("[%s] VOL: need %d ticks, have %d — FAIL (ratio=N/A)", asset, window + 1, len(history))
             return False, 0.0
 
-        baseline_vols = [t.volume for t in history[-(window+1):-1]]
+        # One pass over the `window` ticks before the latest — no intermediate list
+        baseline_sum = sum(t.volume for t in history[-(window+1):-1])
         recent_vol = history[-1].volume
 
-        if not baseline_vols or all(v == 0 for v in baseline_vols):
-            logger.info(f"[{asset}] VOL: baseline all zero (recent={recent_vol:.0f}) — FAIL")
+        if baseline_sum == 0:  # volumes are non-negative, so this means all zero
+            logger.info("[%s] VOL: baseline all zero (recent=%.0f) — FAIL", asset, recent_vol)
             return False, 0.0
 
-        avg_vol = statistics.mean(baseline_vols)
-        if avg_vol == 0:
-            return False, 0.0
+        avg_vol = baseline_sum / window
 
         ratio = recent_vol / avg_vol
         fires = ratio >= self.config.VOLUME_SPIKE_MULTIPLIER
 
-        if fires:
-            logger.info(f"[{asset}] VOL: ratio={ratio:.2f}x (min {self.config.VOLUME_SPIKE_MULTIPLIER}) — PASS")
-        else:
-            logger.info(f"[{asset}] VOL: ratio={ratio:.2f}x (min {self.config.VOLUME_SPIKE_MULTIPLIER}) — FAIL")
+        logger.info("[%s] VOL: ratio=%.2fx (min %s) — %s",
+                    asset, ratio, self.config.VOLUME_SPIKE_MULTIPLIER, "PASS" if fires else "FAIL")
 
         return fires, ratio
 
@@ -613,10 +702,11 @@ class EdgeFilter:
 
         Edge formula: edge = win_prob - implied_prob
         Kelly formula: f* = (p*(b+1) - 1) / b  where p=win_prob, b=net odds
+                     = (p - price) / (1 - price)  (binary share paying $1)
         Kelly size = frac * bankroll (frac = fractional Kelly)
         """
         if side is None or mid_price <= 0 or mid_price >= 1:
-            logger.debug(f"[{asset}] KELLY: early exit side={side} mid={mid_price}")
+            logger.debug("[%s] KELLY: early exit side=%s mid=%s", asset, side, mid_price)
             return 0.0, 0.0, 0.0, 0.0, False
 
         # Implied probability from market price
@@ -630,37 +720,38 @@ class EdgeFilter:
         # Win probability: OB imbalance adds a scaled boost to implied prob.
         # We do NOT use bid_ratio as win_prob directly — a 55% OB ratio doesn't mean
         # 55% win probability; it means ~2-3% edge above the current implied price.
+        ob_edge = None
         if ob_signal and bid_ratio > 0.52 and side == Side.YES:
             ob_edge = (bid_ratio - 0.50) * 0.4  # 55% ratio → +2%, 65% ratio → +6%
-            estimated_prob = min(implied_prob + ob_edge + edge_boost, 0.95)
-            win_prob_source = f"implied+OB+boost={implied_prob:.2%}+{ob_edge:.2%}+{edge_boost:.2%}"
         elif ob_signal and ask_ratio > 0.52 and side == Side.NO:
             ob_edge = (ask_ratio - 0.50) * 0.4  # Same scaling for NO side
+        if ob_edge is not None:
             estimated_prob = min(implied_prob + ob_edge + edge_boost, 0.95)
-            win_prob_source = f"implied+OB+boost={implied_prob:.2%}+{ob_edge:.2%}+{edge_boost:.2%}"
         else:
             estimated_prob = min(implied_prob + edge_boost, 0.95)
-            win_prob_source = f"implied+boost={implied_prob:.2%}+{edge_boost:.2%}"
 
         # Edge = win_prob - implied_prob
         kelly_edge = estimated_prob - implied_prob
 
-        # Kelly: f* = (p * (b+1) - 1) / b
-        b = (1.0 - price) / price if price > 0 else 0
-        kelly_fraction_raw = (estimated_prob * (b + 1) - 1) / b if b > 0 else 0
-
-        kelly_frac = getattr(self.config, "KELLY_FRACTION", 0.5)
-        mode = getattr(self.config, "POSITION_SIZING_MODE", "fractional_kelly")
-        if kelly_fraction_raw <= 0:
-            logger.info(
-                f"[{asset}] KELLY IN | win_prob={estimated_prob:.2%} (from {win_prob_source}) "
-                f"implied={implied_prob:.2%} edge={kelly_edge:.2%} b={b:.4f} -> frac<=0 NO BET"
-            )
+        kelly_frac = self.config.KELLY_FRACTION
+        mode = self.config.POSITION_SIZING_MODE
+        if kelly_edge <= 0:
+            if logger.isEnabledFor(logging.INFO):  # b and the win-prob breakdown are log-only
+                b = (1.0 - price) / price
+                logger.info(
+                    "[%s] KELLY IN | win_prob=%.2f%% (from %s) implied=%.2f%% edge=%.2f%% b=%.4f -> frac<=0 NO BET",
+                    asset, estimated_prob * 100, self._win_prob_source(implied_prob, ob_edge, edge_boost),
+                    implied_prob * 100, kelly_edge * 100, b,
+                )
             return estimated_prob, implied_prob, kelly_edge, 0.0, False
 
-        if mode == "kelly":
+        # Kelly: f* = (p * (b+1) - 1) / b with b = (1-price)/price, which reduces to
+        # (p - price) / (1 - price) — and price is the implied probability, so edge / (1 - price)
+        kelly_fraction_raw = kelly_edge / (1.0 - price)
+
+        if mode is SizingMode.KELLY:
             frac = kelly_fraction_raw
-        elif mode == "fractional_kelly":
+        elif mode is SizingMode.FRACTIONAL_KELLY:
             frac = kelly_fraction_raw * kelly_frac
         else:
             base_pct = min(0.08, max(0.02, kelly_edge + 0.02))
@@ -668,66 +759,46 @@ class EdgeFilter:
 
         br = bankroll if bankroll is not None else self.config.BANKROLL
         raw_size = frac * br
-        max_size = getattr(self.config, "MAX_POSITION_SIZE_USD", self.config.MAX_BET_SIZE)
         kelly_size = max(
             self.config.MIN_BET_SIZE,
-            min(raw_size, max_size)
+            min(raw_size, self.config.MAX_POSITION_SIZE_USD)
         )
 
         signal_fired = kelly_edge >= self.config.MIN_KELLY_EDGE
-        logger.info(
-            f"[{asset}] KELLY OUT | win_prob={estimated_prob:.2%} ({win_prob_source}) "
-            f"implied={implied_prob:.2%} edge={kelly_edge:.2%} size=${kelly_size:.2f} "
-            f"signal={'PASS' if signal_fired else 'FAIL'}"
-        )
+        if logger.isEnabledFor(logging.INFO):  # _win_prob_source formats a string
+            logger.info(
+                "[%s] KELLY OUT | win_prob=%.2f%% (%s) implied=%.2f%% edge=%.2f%% size=$%.2f signal=%s",
+                asset, estimated_prob * 100, self._win_prob_source(implied_prob, ob_edge, edge_boost),
+                implied_prob * 100, kelly_edge * 100, kelly_size, "PASS" if signal_fired else "FAIL",
+            )
         return estimated_prob, implied_prob, kelly_edge, kelly_size, signal_fired
 
+    @staticmethod
+    def _win_prob_source(implied_prob: float, ob_edge: Optional[float], edge_boost: float) -> str:
+        """Human-readable breakdown of the Kelly win probability (log lines only)."""
+        if ob_edge is not None:
+            return f"implied+OB+boost={implied_prob:.2%}+{ob_edge:.2%}+{edge_boost:.2%}"
+        return f"implied+boost={implied_prob:.2%}+{edge_boost:.2%}"
+
     # ── Helpers ───────────────────────────────────────────────────────────────
 
-    def _resolve_directional_side(
-        self,
-        ob_side: Optional[Side],
-        mom_side: Optional[Side],
-        extra_sides: Optional[List[Optional[Side]]] = None,
-    ) -> Optional[Side]:
-        """Return the consensus directional side from all signals."""
-        sides = [s for s in [ob_side, mom_side] + (extra_sides or []) if s is not None]
-        if not sides:
-            return None
-        first = sides[0]
-        if any(s != first for s in sides):
-            return None  # Contradiction
-        return first
-
-    def _directions_agree(
-        self,
-        ob_side: Optional[Side],
-        mom_side: Optional[Side],
-        extra_sides: Optional[List[Optional[Side]]] = None,
-    ) -> bool:
-        """True if no directional contradiction between all signals."""
-        sides = [s for s in [ob_side, mom_side] + (extra_sides or []) if s is not None]
-        if not sides:
-            return True
-        first = sides[0]
-        return all(s == first for s in sides)
+    @staticmethod
+    def _consensus(*sides: Optional[Side]) -> Tuple[Optional[Side], bool]:
+        """
+        (consensus side, directions agree) across all directional signals.
+        Sides fold into a YES=1 / NO=2 bitmask: 3 means a contradiction, 0 means no opinion.
+        """
+        mask = 0
+        for side in sides:
+            mask |= _SIDE_BITS.get(side, 0)
+            if mask == 3:
+                return None, False  # Contradiction — later sides can't change the answer
+        return _MASK_SIDE[mask], True
 
-    def _build_reason(
-        self,
-        ob: bool, mom: bool, vol: bool, kelly: bool,
-        directions_agree: bool, kelly_edge: float,
-        btc_mom: bool = False, eth_lag: bool = False,
-        sol_squeeze: bool = False, xrp_catalyst: bool = False,
-    ) -> str:
-        fired = []
-        if ob: fired.append("OB_IMBALANCE")
-        if mom: fired.append("MOMENTUM")
-        if vol: fired.append("VOLUME_SPIKE")
-        if kelly: fired.append("KELLY")
-        if btc_mom: fired.append("BTC_MOMENTUM")
-        if eth_lag: fired.append("ETH_LAG")
-        if sol_squeeze: fired.append("SOL_SQUEEZE")
-        if xrp_catalyst: fired.append("XRP_CATALYST")
+    @staticmethod
+    def _build_reason(flags: int, directions_agree: bool, kelly_edge: float) -> str:
+        """`flags` has bit i set when _SIGNAL_NAMES[i] fired."""
+        fired = _fired_names(flags)
         if not directions_agree:
-            fired.append("⚠ DIRECTION_CONFLICT")
-        return f"Signals: {', '.join(fired)} | Kelly edge: {kelly_edge:.2%}"
+            fired = f"{fired}, ⚠ DIRECTION_CONFLICT" if fired else "⚠ DIRECTION_CONFLICT"
+        return f"Signals: {fired} | Kelly edge: {kelly_edge:.2%}"
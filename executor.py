@@ -127,7 +127,7 @@ class OrderExecutor:
         half = self.config.MAKER_SPREAD_TARGET / 2
         yes_price = round(max(0.01, mid - half), 4)
         no_price = round(max(0.01, (1 - mid) - half), 4)
-        max_per_trade = getattr(self.config, "MAX_POSITION_SIZE_USD", self.config.MAX_BET_SIZE)
+        max_per_trade = self.config.MAX_POSITION_SIZE_USD
         size_usdc = min(
             self.config.MAKER_MAX_POSITION_SIZE,
             max_per_trade,
@@ -257,7 +257,7 @@ class OrderExecutor:
             "price": str(price),
             "size": str(size),
             "side": side,
-            "orderType": self.config.ORDER_TYPE,  # GTC or FOK
-            "timeInForce": self.config.ORDER_TYPE,
+            "orderType": self.config.ORDER_TYPE.value,  # GTC or FOK
+            "timeInForce": self.config.ORDER_TYPE.value,
             "nonce": str(int(time.time() * 1000)),
         }
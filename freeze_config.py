@@ -0,0 +1,43 @@
+"""
+freeze_config.py — Snapshot the non-secret config env into config_frozen.py at deploy time.
+
+Run once after editing .env (e.g. in deploy.sh or a Docker build step):
+    python freeze_config.py
+
+config.py then reads FROZEN_ENV instead of loading all of .env on every start.
+Real environment variables still win over the snapshot. Secrets (config.SECRET_ENV_KEYS:
+POLY_PRIVATE_KEY, API creds, report credentials) are never written; config.py still reads
+them from .env or the process environment. Delete config_frozen.py to go back to full .env parsing.
+"""
+
+import sys
+from pathlib import Path
+
+_BASE = Path(__file__).resolve().parent
+OUTPUT_FILE = _BASE / "config_frozen.py"
+
+
+def main() -> int:
+    if OUTPUT_FILE.exists():
+        OUTPUT_FILE.unlink()  # Freeze from .env + environment, not from a previous snapshot
+    import config  # loads .env (unless LOAD_DOTENV=0) and snapshots the environment
+
+    frozen = {
+        env_key: config._ENV[env_key]
+        for env_key, _ in (*config._ENV_FIELDS.values(), *config._REPORT_ENV_FIELDS.values())
+        if env_key not in config.SECRET_ENV_KEYS and env_key in config._ENV
+    }
+    lines = [
+        '"""Generated by freeze_config.py — do not edit; re-run the script instead."""',
+        "",
+        "FROZEN_ENV = {",
+    ]
+    lines += [f"    {key!r}: {value!r}," for key, value in frozen.items()]
+    lines += ["}", ""]
+    OUTPUT_FILE.write_text("\n".join(lines), encoding="utf-8")
+    print(f"Wrote {len(frozen)} settings to {OUTPUT_FILE.name} (secrets excluded)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,7 +16,7 @@ import time
 from pathlib import Path
 from typing import Optional
 
-from config import BotConfig
+from config import BotConfig, CATALYST_STATE
 from auth import ensure_clob_creds
 from clob_client import ClobClient
 from market_scanner import MarketScanner
@@ -28,11 +28,11 @@ from risk_manager import RiskManager
 from state_writer import write_state
 from logger import setup_logger
 from binance_feed import BinanceFeed
-from strategy_router import StrategyRouter
+from strategy_router import StrategyRouter, detect_asset
 from models import EdgeResult, Side
 
 # Configure logging early — use config.LOG_FILE so dashboard reads same file as terminal
-config = BotConfig()
+config = BotConfig.from_env()
 logger = setup_logger("main", log_file=config.LOG_FILE)
 
 
@@ -81,7 +81,8 @@ class PolymarketBot:
         self.config = config
         self.clob = ClobClient(config)
         self.scanner = MarketScanner(config, self.clob)
-        self.edge_filter = EdgeFilter(config)
+        self.catalyst_state = CATALYST_STATE
+        self.edge_filter = EdgeFilter(config, catalyst_state=self.catalyst_state)
         self.strategy_router = StrategyRouter(config, self.edge_filter)
         self.executor = OrderExecutor(config, self.clob)
         self.risk_manager = RiskManager(config)
@@ -95,7 +96,7 @@ class PolymarketBot:
         self.running = False
         self.start_time: Optional[datetime] = None
         self.signal_feed: list = []
-        self._last_orphan_reconcile: Optional[float] = 0.0
+        self._last_orphan_reconcile: Optional[float] = None  # time.monotonic() of last reconcile
         self.btc_signal_state = {
             "fired": False,
             "side": None,
@@ -217,33 +218,30 @@ class PolymarketBot:
             logger.info("CLOSE_ON_RESTART=false — leaving positions open for resume")
         await self.binance_feed.stop()
         await self.clob.close()
+        from daily_report import close_session
+        await close_session()  # The report session lives on this loop; run() calls us from finally
 
     async def report_scheduler_loop(self):
         """Run daily report at 11:59 PM UTC (or REPORT_SEND_TIME_UTC). Weekly report on Sundays."""
-        if not getattr(self.config, "DAILY_REPORT_ENABLED", True):
+        report_cfg = self.config.report
+        if report_cfg is None:
             return
-        send_time = getattr(self.config, "REPORT_SEND_TIME_UTC", "23:59") or "23:59"
-        try:
-            parts = send_time.replace(":", " ").split()
-            h = int(parts[0]) if parts else 23
-            m = int(parts[1]) if len(parts) > 1 else 59
-        except Exception:
-            h, m = 23, 59
-        weekly_day = getattr(self.config, "WEEKLY_REPORT_DAY", "sunday").lower()
+        send_minute = report_cfg.REPORT_SEND_MINUTE_OF_DAY
+        weekly_day = report_cfg.WEEKLY_REPORT_DAY
         weekdays = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
         weekly_weekday = weekdays.index(weekly_day) if weekly_day in weekdays else 6  # Sunday=6
 
         while self.running:
             try:
                 now = datetime.now(timezone.utc)
-                # Check if we're within the report minute (23:59)
-                if now.hour == h and now.minute == m:
+                # Check if we're within the report minute (REPORT_SEND_TIME_UTC)
+                if now.hour * 60 + now.minute == send_minute:
                     logger.info("Running scheduled daily report...")
                     try:
-                        from daily_report import run_daily_report, run_weekly_report
-                        run_daily_report(send_email_flag=True, send_discord_flag=True)
+                        from daily_report import run_daily_report_async, run_weekly_report
+                        await run_daily_report_async(send_email_flag=True, send_discord_flag=True)
                         if now.weekday() == weekly_weekday:
-                            run_weekly_report()
+                            await asyncio.to_thread(run_weekly_report)
                             logger.info("Weekly report generated")
                     except Exception as e:
                         logger.error(f"Report generation failed: {e}", exc_info=True)
@@ -257,7 +255,7 @@ class PolymarketBot:
                 await asyncio.sleep(60)
 
     async def catalyst_watcher(self):
-        """Read catalyst_flag.json every 30s and update config."""
+        """Read catalyst_flag.json every 30s and update the shared catalyst state."""
         path = Path("catalyst_flag.json")
         while self.running:
             try:
@@ -267,9 +265,7 @@ class PolymarketBot:
                 text = path.read_text()
                 data = json.loads(text)
                 if data.get("asset") == "XRP":
-                    self.config.XRP_CATALYST_ACTIVE = True
-                    self.config.XRP_CATALYST_DIRECTION = data.get("direction", "UP").upper()
-                    self.config.XRP_CATALYST_SET_TIME = datetime.now(timezone.utc).isoformat()
+                    self.catalyst_state.activate(data.get("direction", "UP"))
                     logger.info(f"XRP catalyst set: {data.get('direction', 'UP')} — {data.get('reason', '')}")
             except Exception as e:
                 if path.exists():
@@ -368,9 +364,10 @@ class PolymarketBot:
                         self._live_bankroll = bal
 
                 # Clear BTC signal state if expired
+                scan_now = datetime.now(timezone.utc)  # One clock read shared by every market this pass
                 ts = self.btc_signal_state.get("timestamp")
                 if ts:
-                    elapsed = (datetime.now(timezone.utc) - ts).total_seconds()
+                    elapsed = (scan_now - ts).total_seconds()
                     if elapsed > self.config.ETH_LAG_EXPIRY_SECONDS:
                         self.btc_signal_state["fired"] = False
 
@@ -381,8 +378,9 @@ class PolymarketBot:
                 logger.info(f"Scanned {num_markets} active 15-min markets")
 
                 # Orphan reconciliation (periodic)
-                now_ts = time.time()
-                if (now_ts - (self._last_orphan_reconcile or 0)) >= self.config.ORPHAN_RECONCILE_INTERVAL_SECONDS:
+                now_ts = time.monotonic()
+                last_reconcile = self._last_orphan_reconcile
+                if last_reconcile is None or now_ts - last_reconcile >= self.config.ORPHAN_RECONCILE_INTERVAL_SECONDS:
                     try:
                         orphans = await self.orphan_handler.reconcile(markets, add_orphans=True)
                         if orphans:
@@ -391,6 +389,12 @@ class PolymarketBot:
                     except Exception as e:
                         logger.warning(f"Orphan reconcile failed: {e}")
 
+                # Markets are evaluated one by one (BTC state feeds ETH lag, positions gate later
+                # markets), but their funding-rate fetches are independent — issue them together
+                await self.strategy_router.prefetch_funding_rates(
+                    self.binance_feed, {self._asset(m.question) for m in markets}
+                )
+
                 # Process BTC first to update btc_signal_state for ETH lag
                 btc_markets = [m for m in markets if self._asset(m.question) == "BTC"]
                 other_markets = [m for m in markets if m not in btc_markets]
@@ -410,6 +414,7 @@ class PolymarketBot:
                         self.binance_feed,
                         self.btc_signal_state,
                         bankroll=bankroll,
+                        now_utc=scan_now,
                     )
 
                     # Risk checks (only when edge found): daily loss limit, per-trade limit
@@ -426,7 +431,7 @@ class PolymarketBot:
                         min_edge_boost = getattr(self.config, "LOSS_STREAK_REQUIRE_HIGHER_EDGE", 2)
                         if can_trade and loss_streak >= min_edge_boost:
                             extra_edge = 0.02
-                            if edge_result.kelly_edge < max(self.config.MIN_KELLY_EDGE, getattr(self.config, "MIN_EDGE_PCT", 0.03)) + extra_edge:
+                            if edge_result.kelly_edge < self.config.MIN_TRADE_EDGE + extra_edge:
                                 can_trade = False
                                 logger.warning(f"Loss streak {loss_streak} — requiring +{extra_edge:.0%} extra edge, skipping")
                         if not can_trade and risk_reason:
@@ -512,7 +517,7 @@ class PolymarketBot:
             if mid is None or mid <= 0:
                 mid = 0.50
             side = Side.YES if mid <= 0.55 else Side.NO
-            size = min(10.0, self.config.MAX_BET_SIZE)
+            size = min(10.0, self.config.MAX_POSITION_SIZE_USD)
             edge = EdgeResult(
                 has_edge=True,
                 side=side,
@@ -542,18 +547,7 @@ class PolymarketBot:
 
     def _asset(self, question) -> str:
         """Extract asset (BTC/ETH/SOL/XRP) from question string or Market object."""
-        if hasattr(question, "question"):
-            question = question.question
-        q = (str(question) if question is not None else "").lower()
-        if "bitcoin" in q or "btc" in q:
-            return "BTC"
-        if "ethereum" in q or "eth" in q:
-            return "ETH"
-        if "solana" in q or "sol" in q:
-            return "SOL"
-        if "xrp" in q or "ripple" in q:
-            return "XRP"
-        return "UNKNOWN"
+        return detect_asset(question)
 
     def _append_signal_feed(self, market, edge_result, entered: bool):
         """Append an EdgeResult evaluation to signal_feed for dashboard display."""
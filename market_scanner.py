@@ -11,6 +11,7 @@ from typing import List, Optional
 
 from config import BotConfig
 from clob_client import ClobClient
+from edge_filter import asset_from_question
 from gamma_client import fetch_crypto_15min_markets, fetch_15min_markets_by_slugs
 from models import Market, OrderBook, OrderBookLevel, PriceTick
 
@@ -119,6 +120,7 @@ class MarketScanner:
                 no_token_id=str(token_ids[1]),
                 end_date_iso=end_str,
                 end_timestamp=end_ts,
+                asset=asset_from_question(str(question)),  # Tagged once here; router/edge filter reuse it
             )
         except Exception as e:
             logger.debug(f"Failed to parse Gamma market: {e}")
@@ -197,20 +199,18 @@ class MarketScanner:
                 return None
 
     def _parse_order_book(self, raw: dict) -> OrderBook:
-        ob = OrderBook(timestamp=datetime.now(timezone.utc))
-        for level in raw.get("bids", []):
-            ob.yes_bids.append(OrderBookLevel(
-                price=float(level["price"]),
-                size=float(level["size"]),
-            ))
-        for level in raw.get("asks", []):
-            ob.yes_asks.append(OrderBookLevel(
-                price=float(level["price"]),
-                size=float(level["size"]),
-            ))
-        ob.yes_bids.sort(key=lambda x: x.price, reverse=True)
-        ob.yes_asks.sort(key=lambda x: x.price)
-        return ob
+        bids = [
+            OrderBookLevel(price=float(level["price"]), size=float(level["size"]))
+            for level in raw.get("bids", [])
+        ]
+        asks = [
+            OrderBookLevel(price=float(level["price"]), size=float(level["size"]))
+            for level in raw.get("asks", [])
+        ]
+        bids.sort(key=lambda x: x.price, reverse=True)
+        asks.sort(key=lambda x: x.price)
+        # Levels are sorted before the book is built, so its cumulative depth is computed once, in order
+        return OrderBook(yes_bids=bids, yes_asks=asks, timestamp=datetime.now(timezone.utc))
 
     def _parse_price_history(self, raw: dict) -> List[PriceTick]:
         ticks = []
@@ -3,6 +3,7 @@ models.py — Shared data structures used across all modules.
 """
 
 from dataclasses import dataclass, field
+from itertools import accumulate
 from typing import Optional, List
 from datetime import datetime, timezone
 from enum import Enum
@@ -39,13 +40,39 @@ class OrderBook:
             return (self.best_yes_bid + self.best_yes_ask) / 2
         return None
 
+    # Running price × size totals per level, built when the book is assembled. Levels are
+    # treated as fixed from then on; call refresh_depth() after replacing or editing them.
+    _bid_cum: List[float] = field(default_factory=list, init=False, repr=False, compare=False)
+    _ask_cum: List[float] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.refresh_depth()
+
+    def refresh_depth(self) -> None:
+        """Rebuild the cumulative depth totals from the current bid/ask levels."""
+        self._bid_cum = list(accumulate(l.price * l.size for l in self.yes_bids))
+        self._ask_cum = list(accumulate(l.price * l.size for l in self.yes_asks))
+
+    @staticmethod
+    def _depth(cum: List[float], levels: Optional[int]) -> float:
+        n = len(cum) if levels is None else min(levels, len(cum))
+        return cum[n - 1] if n > 0 else 0.0
+
+    def bid_depth(self, levels: Optional[int] = None) -> float:
+        """USDC notional of the top `levels` bids (all levels when None)."""
+        return self._depth(self._bid_cum, levels)
+
+    def ask_depth(self, levels: Optional[int] = None) -> float:
+        """USDC notional of the top `levels` asks (all levels when None)."""
+        return self._depth(self._ask_cum, levels)
+
     @property
     def total_bid_depth(self) -> float:
-        return sum(l.price * l.size for l in self.yes_bids)
+        return self.bid_depth()
 
     @property
     def total_ask_depth(self) -> float:
-        return sum(l.price * l.size for l in self.yes_asks)
+        return self.ask_depth()
 
 
 @dataclass
@@ -160,7 +160,7 @@ class RiskManager:
         """Max USDC per trade (per-trade loss limit). Capped by MAX_POSITION_SIZE_USD."""
         per_trade_pct = getattr(self.config, "PER_TRADE_MAX_LOSS_PCT", 0.10)
         cap_from_risk = bankroll * per_trade_pct
-        max_position = getattr(self.config, "MAX_POSITION_SIZE_USD", self.config.MAX_BET_SIZE)
+        max_position = self.config.MAX_POSITION_SIZE_USD
         return min(cap_from_risk, max_position)
 
     def get_state(self, bankroll: float) -> dict:
@@ -11,6 +11,7 @@ import json
 import math
 import time
 from collections import defaultdict
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional
@@ -32,13 +33,21 @@ def _get_log_path() -> Path:
     """Use same LOG_FILE as bot (from config/env) so dashboard matches terminal output."""
     try:
         from config import BotConfig
-        log_file = BotConfig().LOG_FILE or "bot.log"
+        log_file = BotConfig.from_env().LOG_FILE or "bot.log"
         p = Path(log_file)
         return p if p.is_absolute() else BASE_DIR / log_file
     except Exception:
         return BASE_DIR / "bot.log"
 
-app = FastAPI(title="Polymarket Bot Dashboard")
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    # /api/generate-report opens the shared report session on this loop; close it on shutdown
+    from daily_report import close_session
+    await close_session()
+
+
+app = FastAPI(title="Polymarket Bot Dashboard", lifespan=_lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -62,7 +71,7 @@ async def fetch_live_balance() -> Optional[float]:
         from config import BotConfig
         from clob_client import ClobClient
 
-        cfg = BotConfig()
+        cfg = BotConfig.from_env()
         if not cfg.API_KEY or not cfg.API_SECRET:
             return None
         if cfg.PAPER_TRADING:
@@ -204,14 +213,14 @@ def get_config_values() -> dict:
     """Read key config values for dashboard (min edge, loss limit, etc.)."""
     try:
         from config import BotConfig
-        c = BotConfig()
+        c = BotConfig.from_env()
         return {
             "min_edge_pct": round(c.MIN_EDGE_PCT * 100, 1),
             "min_kelly_edge": round(c.MIN_KELLY_EDGE * 100, 1),
             "daily_loss_limit_pct": round(c.DAILY_LOSS_LIMIT_PCT * 100, 0),
             "daily_goal_usd": c.DAILY_PROFIT_GOAL_USD,
             "max_positions": c.MAX_POSITIONS,
-            "max_bet_size": c.MAX_BET_SIZE,
+            "max_bet_size": c.MAX_POSITION_SIZE_USD,
             "min_edge_signals": c.MIN_EDGE_SIGNALS,
         }
     except Exception:
@@ -298,14 +307,14 @@ async def get_status():
 
     try:
         from config import BotConfig
-        goal = BotConfig().DAILY_PROFIT_GOAL_USD
+        goal = BotConfig.from_env().DAILY_PROFIT_GOAL_USD
     except Exception:
         goal = 1000.0
 
     risk_state = (state.get("bot_activity") or {}).get("risk_state") or {}
     try:
         from config import BotConfig
-        loss_limit_pct = BotConfig().DAILY_LOSS_LIMIT_PCT
+        loss_limit_pct = BotConfig.from_env().DAILY_LOSS_LIMIT_PCT
     except Exception:
         loss_limit_pct = 0.20
     daily_loss_limit = bankroll * loss_limit_pct
@@ -507,7 +516,7 @@ async def get_goal_tracking():
     )
     try:
         from config import BotConfig
-        goal = BotConfig().DAILY_PROFIT_GOAL_USD
+        goal = BotConfig.from_env().DAILY_PROFIT_GOAL_USD
     except Exception:
         goal = 1000.0
 
@@ -612,8 +621,8 @@ async def generate_report(send_email: bool = False, send_discord: bool = False):
     Returns the generated report. Optionally send via email/discord.
     """
     try:
-        from daily_report import run_daily_report, generate_daily_report
-        report = run_daily_report(send_email_flag=send_email, send_discord_flag=send_discord)
+        from daily_report import run_daily_report_async
+        report = await run_daily_report_async(send_email_flag=send_email, send_discord_flag=send_discord)
         return {"success": True, "report": report, "date": report.get("date")}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -834,7 +843,7 @@ async def websocket_endpoint(websocket: WebSocket):
 
             try:
                 from config import BotConfig
-                goal = BotConfig().DAILY_PROFIT_GOAL_USD
+                goal = BotConfig.from_env().DAILY_PROFIT_GOAL_USD
             except Exception:
                 goal = 1000.0
             daily_pnl = stats.get("today_pnl", 0)
@@ -24,7 +24,7 @@ SESSION_START_FILE = _BASE / "session_start.json"
 def _trades_csv_path() -> Path:
     try:
         from config import BotConfig
-        p = Path(BotConfig().TRADE_LOG_FILE)
+        p = Path(BotConfig.from_env().TRADE_LOG_FILE)
         return p if p.is_absolute() else _BASE / p
     except Exception:
         return _BASE / "trades.csv"
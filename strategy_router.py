@@ -9,30 +9,25 @@ Strategy assignment:
   XRP markets  → Strategy 5 (Catalyst Only) — no trade without active catalyst
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
 
 from config import BotConfig
-from edge_filter import EdgeFilter
+from edge_filter import EdgeFilter, asset_from_question
 from models import Market, EdgeResult
 
 logger = logging.getLogger("strategy_router")
 
+FUNDING_ASSETS = ("BTC", "ETH", "SOL")  # Assets whose evaluation uses the Binance funding rate
+
 
 def detect_asset(question) -> str:
     """Parse market question for asset: BTC, ETH, SOL, XRP, or UNKNOWN."""
     if hasattr(question, "question"):
         question = question.question
-    q = (str(question) if question is not None else "").lower()
-    if "bitcoin" in q or "btc" in q:
-        return "BTC"
-    if "ethereum" in q or "eth" in q:
-        return "ETH"
-    if "solana" in q or "sol" in q:
-        return "SOL"
-    if "xrp" in q or "ripple" in q:
-        return "XRP"
-    return "UNKNOWN"
+    return asset_from_question(str(question) if question is not None else "")
 
 
 class BinanceFeedInterface:
@@ -56,18 +51,34 @@ class StrategyRouter:
         self.config = config
         self.edge_filter = edge_filter
 
+    async def prefetch_funding_rates(
+        self, binance_feed: BinanceFeedInterface, assets: Iterable[str]
+    ) -> None:
+        """
+        Warm the feed's funding-rate cache for every asset in this scan at once,
+        so route() hits the cache instead of fetching one symbol per market in turn.
+        """
+        wanted = set(assets)
+        symbols = [a for a in FUNDING_ASSETS if a in wanted]
+        if symbols:
+            await asyncio.gather(
+                *(binance_feed.get_funding_rate(a) for a in symbols),
+                return_exceptions=True,
+            )
+
     async def route(
         self,
         market: Market,
         binance_feed: BinanceFeedInterface,
         btc_signal_state: Dict[str, Any],
         bankroll: Optional[float] = None,
+        now_utc: Optional[datetime] = None,
     ) -> EdgeResult:
         """
         Route a market to the correct strategy evaluation.
         Returns EdgeResult — if has_edge is False, bot does not trade.
         """
-        asset = detect_asset(market.question)
+        asset = market.asset or detect_asset(market.question)
         market.asset = asset
 
         # Get live price feed (Kraken/Coinbase/CoinGecko)
@@ -87,7 +98,7 @@ class StrategyRouter:
         btc_is_neutral_or_up = btc_pct is None or btc_pct >= -0.002
 
         funding_rate = 0.0
-        if asset in ("BTC", "ETH", "SOL"):
+        if asset in FUNDING_ASSETS:
             funding_rate = await binance_feed.get_funding_rate(asset)
 
         btc_price_history = None
@@ -104,6 +115,7 @@ class StrategyRouter:
             btc_is_neutral_or_up=btc_is_neutral_or_up,
             btc_price_history=btc_price_history,
             bankroll=bankroll,
+            now_utc=now_utc,
         )
         result.asset = asset
         return result
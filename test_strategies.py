@@ -5,10 +5,10 @@ Uses unittest.mock to avoid live API calls.
 
 import asyncio
 import unittest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from config import BotConfig
+from config import BotConfig, CatalystState
 from edge_filter import EdgeFilter
 from models import Market, OrderBook, OrderBookLevel, PriceTick, Side
 from strategy_router import detect_asset
@@ -99,11 +99,30 @@ class TestSOLSqueezeSignal(unittest.TestCase):
         self.config = BotConfig()
         self.filter = EdgeFilter(self.config)
 
-    def test_rsi_calculation(self):
+    def test_market_rsi(self):
+        now = datetime.now(timezone.utc)
+        market = _make_market("SOL up or down")
+        market.price_history = [PriceTick(0.5, 1, now)] * 10
+        self.assertEqual(self.filter._market_rsi(market), 50.0)  # too few ticks
         # Oversold: declining prices
-        prices = [100 - i for i in range(20)]
-        rsi = EdgeFilter._calculate_rsi(prices)
-        self.assertLess(rsi, 50)
+        market.price_history = [
+            PriceTick(0.7 - 0.01 * i, 1, now + timedelta(minutes=i)) for i in range(20)
+        ]
+        self.assertLess(EdgeFilter(self.config)._market_rsi(market), 50)
+
+    def test_market_rsi_incremental_matches_reseed(self):
+        now = datetime.now(timezone.utc)
+        ticks = [
+            PriceTick(0.5 + (0.01 if i % 3 else -0.02) * i / 10, 1, now + timedelta(minutes=i))
+            for i in range(30)
+        ]
+        market = _make_market("SOL up or down")
+        market.price_history = ticks[:20]
+        self.filter._market_rsi(market)
+        market.price_history = ticks
+        incremental = self.filter._market_rsi(market)
+        fresh = EdgeFilter(self.config)._market_rsi(market)
+        self.assertAlmostEqual(incremental, fresh)
 
     def test_squeeze_needs_uptick(self):
         now = datetime.now(timezone.utc)
@@ -158,20 +177,43 @@ class TestXRPCatalystExpiry(unittest.TestCase):
 
     def test_no_catalyst_no_trade(self):
         config = BotConfig()
-        config.XRP_CATALYST_ACTIVE = False
-        filter = EdgeFilter(config)
+        filter = EdgeFilter(config, catalyst_state=CatalystState(active=False))
         signal, _ = filter._check_xrp_catalyst()
         self.assertFalse(signal)
 
     def test_catalyst_active_returns_side(self):
         config = BotConfig()
-        config.XRP_CATALYST_ACTIVE = True
-        config.XRP_CATALYST_DIRECTION = "UP"
-        filter = EdgeFilter(config)
+        state = CatalystState(active=True, direction="UP")
+        filter = EdgeFilter(config, catalyst_state=state)
         signal, side = filter._check_xrp_catalyst()
         self.assertTrue(signal)
         self.assertEqual(side, Side.YES)
 
+    def test_catalyst_expires_after_window(self):
+        config = BotConfig()
+        state = CatalystState()
+        state.activate("down")
+        filter = EdgeFilter(config, catalyst_state=state)
+        signal, side = filter._check_xrp_catalyst()
+        self.assertTrue(signal)
+        self.assertEqual(side, Side.NO)
+        state.set_epoch -= config.XRP_CATALYST_EXPIRY_MINUTES * 60 + 1
+        signal, _ = filter._check_xrp_catalyst()
+        self.assertFalse(signal)
+        self.assertFalse(state.active)
+
+
+class TestLiveConfig(unittest.TestCase):
+    """EdgeFilter reads thresholds from its config on every call."""
+
+    def test_config_edit_after_construction_applies(self):
+        config = BotConfig()
+        filter_ = EdgeFilter(config)
+        _, _, _, size, _ = filter_._check_kelly(0.5, Side.YES, edge_boost=0.2, bankroll=1000)
+        config.MAX_POSITION_SIZE_USD = size / 2
+        _, _, _, capped, _ = filter_._check_kelly(0.5, Side.YES, edge_boost=0.2, bankroll=1000)
+        self.assertAlmostEqual(capped, size / 2)
+
 
 class TestActiveHoursGate(unittest.TestCase):
     """Directional strategies blocked outside 9AM-4PM ET."""
@@ -306,6 +348,56 @@ class TestOBImbalanceNoSide(unittest.TestCase):
         signal, side, _, _ = filter_._check_order_book_imbalance(yes_ob, no_ob)
         self.assertFalse(signal)
 
+    def test_exact_threshold_book_passes(self):
+        config = BotConfig()
+        filter_ = EdgeFilter(config)
+        ob = OrderBook(
+            yes_bids=[OrderBookLevel(0.50, 1100)],  # $550 vs $450 = exactly 55%
+            yes_asks=[OrderBookLevel(0.50, 900)],
+        )
+        signal, side, bid_ratio, _ = filter_._check_order_book_imbalance(ob)
+        self.assertTrue(signal)
+        self.assertEqual(side, Side.YES)
+        self.assertAlmostEqual(bid_ratio, config.OB_IMBALANCE_THRESHOLD)
+
+    def test_level_decay_favors_top_of_book(self):
+        config = BotConfig()
+        filter_ = EdgeFilter(config)
+        ob = OrderBook(
+            yes_bids=[OrderBookLevel(0.50, 100)] + [OrderBookLevel(0.40, 10)] * 4,
+            yes_asks=[OrderBookLevel(0.60, 10)] + [OrderBookLevel(0.70, 30)] * 4,
+        )
+        _, flat_side, _, _ = filter_._check_order_book_imbalance(ob)
+        self.assertEqual(flat_side, Side.NO)
+        config.OB_LEVEL_DECAY = 1.0
+        _, decayed_side, _, _ = filter_._check_order_book_imbalance(ob)
+        self.assertEqual(decayed_side, Side.YES)
+
+    def test_depth_follows_book_changes(self):
+        ob = OrderBook(
+            yes_bids=[OrderBookLevel(0.50, 100), OrderBookLevel(0.40, 100)],
+            yes_asks=[OrderBookLevel(0.60, 100)],
+        )
+        self.assertAlmostEqual(ob.bid_depth(1), 50.0)
+        self.assertAlmostEqual(ob.total_bid_depth, 90.0)
+        # Same-length replacement and an in-place edit both show up after refresh_depth()
+        ob.yes_bids = [OrderBookLevel(0.45, 200), OrderBookLevel(0.40, 100)]
+        ob.yes_asks[0].size = 50
+        ob.refresh_depth()
+        self.assertAlmostEqual(ob.bid_depth(1), 90.0)
+        self.assertAlmostEqual(ob.total_bid_depth, 130.0)
+        self.assertAlmostEqual(ob.total_ask_depth, 30.0)
+
+
+class TestDirectionalConsensus(unittest.TestCase):
+    """Consensus side is None on contradiction; no opinions count as agreement."""
+
+    def test_consensus(self):
+        self.assertEqual(EdgeFilter._consensus(None, None), (None, True))
+        self.assertEqual(EdgeFilter._consensus(Side.YES, None, Side.YES), (Side.YES, True))
+        self.assertEqual(EdgeFilter._consensus(None, Side.NO), (Side.NO, True))
+        self.assertEqual(EdgeFilter._consensus(Side.YES, Side.NO), (None, False))
+
 
 class TestPortfolioRiskCap(unittest.TestCase):
     """MAX_PORTFOLIO_RISK enforcement."""